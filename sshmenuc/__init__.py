@@ -1,6 +1,4 @@
-from .core import ConnectionManager, ConnectionNavigator, SSHLauncher
-from .ui import Colors, MenuDisplay
-from .utils import setup_logging, setup_argument_parser
+from importlib import import_module
 
 __version__ = "1.4.1"
 __all__ = [
@@ -12,3 +10,28 @@ __all__ = [
     'setup_logging',
     'setup_argument_parser'
 ]
+
+# Public names are resolved on first access (PEP 562), so importing a single
+# submodule (e.g. sshmenuc.main, sshmenuc.sync) does not load the whole package.
+_LAZY_EXPORTS = {
+    'ConnectionManager': '.core',
+    'ConnectionNavigator': '.core',
+    'SSHLauncher': '.core',
+    'Colors': '.ui',
+    'MenuDisplay': '.ui',
+    'setup_logging': '.utils',
+    'setup_argument_parser': '.utils',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -14,25 +14,59 @@ fall back to single-file mode (the original behavior).
 import json
 import logging
 import os
-from typing import Dict, List, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+
+from ..utils import serialization
 
 
 CONTEXTS_CONFIG_PATH = os.path.expanduser("~/.config/sshmenuc/contexts.json")
 CONTEXTS_BASE_DIR = os.path.expanduser("~/.config/sshmenuc/contexts")
 
+# Parsed registries shared across instances: abspath -> ((st_mtime_ns, st_size), snapshot).
+# Each instance restores its own copy (see serialization.snapshot()), so a change
+# whose write failed never leaks into other instances. A changed mtime or size
+# invalidates the entry; _save() refreshes it only after a successful write.
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+@lru_cache(maxsize=64)
+def _ctx_dir(base_dir: str, name: str) -> str:
+    """Return the local cache directory of a context (memoized path join)."""
+    return os.path.join(base_dir, name)
+
 
 class ContextManager:
     """Manages named SSH config profiles stored in contexts.json."""
 
+    __slots__ = ("_path", "_data", "_loaded", "_sorted_names", "_batch_depth", "_batch_dirty")
+
     def __init__(self, contexts_config_path: Optional[str] = None):
         self._path = contexts_config_path or CONTEXTS_CONFIG_PATH
         self._data: Dict = {}
         self._loaded = False
+        self._sorted_names: Optional[Tuple[str, ...]] = None  # Reset by _save()
+        self._batch_depth = 0  # Nesting level of batch() blocks; writes are deferred while > 0
+        self._batch_dirty = False
 
     # -------------------------------------------------------------------------
     # Public interface
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def registry_exists(contexts_config_path: Optional[str] = None) -> bool:
+        """Return True if the contexts.json registry file exists.
+
+        A single stat, without building a manager or reading the file, so
+        single-file mode can skip the registry entirely.
+
+        Args:
+            contexts_config_path: Registry path (default: CONTEXTS_CONFIG_PATH)
+        """
+        return os.path.isfile(contexts_config_path or CONTEXTS_CONFIG_PATH)
+
     def has_contexts(self) -> bool:
         """Return True if contexts.json exists and contains at least one context."""
         data = self._load()
@@ -40,7 +74,7 @@ class ContextManager:
 
     def list_contexts(self) -> List[str]:
         """Return context names sorted alphabetically."""
-        return sorted(self._load().get("contexts", {}).keys())
+        return list(self._context_names())
 
     def discover_available(self, sync_repo_path: str) -> List[str]:
         """Return .enc filenames in sync_repo_path not linked to any registered context."""
@@ -66,25 +100,35 @@ class ContextManager:
         contexts = data.get("contexts", {})
         if active in contexts:
             return active
-        names = sorted(contexts.keys())
+        names = self._context_names()
         return names[0] if names else ""
 
     def get_config_file(self, name: str) -> str:
         """Return the local plaintext config.json path for a context."""
-        return os.path.join(CONTEXTS_BASE_DIR, name, "config.json")
+        return os.path.join(_ctx_dir(CONTEXTS_BASE_DIR, name), "config.json")
 
     def get_enc_file(self, name: str) -> str:
         """Return the local encrypted backup path for a context."""
-        return os.path.join(CONTEXTS_BASE_DIR, name, "config.json.enc")
+        return os.path.join(_ctx_dir(CONTEXTS_BASE_DIR, name), "config.json.enc")
 
-    def get_sync_cfg(self, name: str) -> dict:
+    def get_sync_cfg(self, name: str, readonly: bool = False) -> Mapping:
         """Return the sync configuration dict for a context.
 
         The returned dict mirrors the structure expected by SyncManager, with
         the addition of 'remote_file' for multi-file repos.
+
+        Args:
+            name: Context name
+            readonly: Return a read-only view of the stored entry instead of
+                a copy; for callers that only read a few fields
+
+        Returns:
+            A mutable copy, or a MappingProxyType view when readonly is True
         """
         data = self._load()
         ctx = data.get("contexts", {}).get(name, {})
+        if readonly:
+            return MappingProxyType(ctx)
         return dict(ctx)  # Copy to avoid mutation of internal state
 
     def set_active(self, name: str) -> None:
@@ -114,6 +158,36 @@ class ContextManager:
             data["active"] = name
         self._save(data)
 
+    def add_contexts(self, contexts: Dict[str, dict]) -> None:
+        """Add or replace several context entries with a single write.
+
+        Args:
+            contexts: Mapping of context name -> sync config dict
+        """
+        with self.batch():
+            for name, cfg in contexts.items():
+                self.add_context(name, cfg)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer contexts.json writes until the block exits.
+
+        Every change made inside the block is persisted by one final save,
+        instead of rewriting the whole file once per change. Blocks nest;
+        only the outermost one writes.
+
+        Yields:
+            None
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self._save(self._data)
+
     def update_sync_config(self, name: str, partial_cfg: dict) -> None:
         """Merge partial_cfg into the sync config of an existing context.
 
@@ -145,29 +219,61 @@ class ContextManager:
 
     def ensure_context_dir(self, name: str) -> None:
         """Create the local cache directory for a context if it does not exist."""
-        os.makedirs(os.path.join(CONTEXTS_BASE_DIR, name), exist_ok=True)
+        os.makedirs(_ctx_dir(CONTEXTS_BASE_DIR, name), exist_ok=True)
 
     # -------------------------------------------------------------------------
     # Internal helpers
     # -------------------------------------------------------------------------
 
     def _load(self) -> dict:
-        """Load and cache contexts.json from disk. Returns empty dict if absent."""
+        """Load and cache contexts.json from disk. Returns empty dict if absent.
+
+        The parsed registry is cached for other instances reading the same
+        file, and reused while the file's mtime and size are unchanged.
+        """
         if not self._loaded:
             try:
-                with open(self._path, "r") as f:
-                    self._data = json.load(f)
+                path, stat_key = self._stat_key()
+                cached = _FILE_CACHE.get(path)
+                if cached is not None and cached[0] == stat_key:
+                    self._data = serialization.restore(cached[1])
+                else:
+                    self._data = serialization.load_file(path)
+                    _FILE_CACHE[path] = (stat_key, serialization.snapshot(self._data))
             except (FileNotFoundError, json.JSONDecodeError):
                 self._data = {}
             self._loaded = True
         return self._data
 
+    def _context_names(self) -> Tuple[str, ...]:
+        """Return the sorted context names, re-sorting only after the registry changed."""
+        data = self._load()
+        if self._sorted_names is None:
+            self._sorted_names = tuple(sorted(data.get("contexts", {})))
+        return self._sorted_names
+
+    def _stat_key(self) -> Tuple[str, Tuple[int, int]]:
+        """Return the absolute registry path and its (mtime_ns, size) cache key.
+
+        Raises:
+            FileNotFoundError: If contexts.json does not exist
+        """
+        path = os.path.abspath(self._path)
+        st = os.stat(path)
+        return path, (st.st_mtime_ns, st.st_size)
+
     def _save(self, data: dict) -> None:
         """Persist data to contexts.json, creating parent directory if needed."""
+        self._sorted_names = None  # data may already be mutated in place, even if the write fails
+        if self._batch_depth:
+            self._data = data
+            self._batch_dirty = True
+            return
         os.makedirs(os.path.dirname(self._path), exist_ok=True)
         try:
-            with open(self._path, "w") as f:
-                json.dump(data, f, indent=4)
+            serialization.dump_file(data, self._path, pretty=False)  # Machine-managed registry
             self._data = data  # Update cache
+            path, stat_key = self._stat_key()
+            _FILE_CACHE[path] = (stat_key, serialization.snapshot(data))
         except OSError as e:
             logging.error(f"[CTX] Cannot write contexts.json: {e}")
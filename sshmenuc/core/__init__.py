@@ -1,9 +1,28 @@
 """
 Core module per sshmenuc.
 """
-from .base import BaseSSHMenuC
-from .config import ConnectionManager
-from .navigation import ConnectionNavigator
-from .launcher import SSHLauncher
+from importlib import import_module
 
-__all__ = ['BaseSSHMenuC', 'ConnectionManager', 'ConnectionNavigator', 'SSHLauncher']
\ No newline at end of file
+__all__ = ['BaseSSHMenuC', 'ConnectionManager', 'ConnectionNavigator', 'SSHLauncher']
+
+# Resolved on first access (PEP 562): importing one submodule (e.g.
+# sshmenuc.core.config) does not load the navigator's UI and sync stack.
+_LAZY_EXPORTS = {
+    'BaseSSHMenuC': '.base',
+    'ConnectionManager': '.config',
+    'ConnectionNavigator': '.navigation',
+    'SSHLauncher': '.launcher',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
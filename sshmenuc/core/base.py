@@ -4,11 +4,26 @@ Provides shared functionality and common patterns.
 """
 import json
 import os
-import shlex
 import logging
-from typing import Dict, Any, List, Union, Optional
+from typing import Dict, Any, Optional, Tuple
 from abc import ABC, abstractmethod
 
+from ..utils import serialization
+
+
+# Parsed config files shared across instances: abspath -> ((st_mtime_ns, st_size), snapshot).
+# Each hit restores its own copy (see serialization.snapshot()), so unsaved in-place
+# edits never leak into other instances. A changed mtime or size invalidates the
+# entry; save_config() refreshes it only after a successful write.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+# Characters that can make shlex.split() fail (unclosed quote, trailing escape).
+# extra_args without any of them always split cleanly, so the lexer is skipped.
+_SHLEX_QUOTING_CHARS = frozenset("\"'\\")
+
+# Files this small ("", "{}") cannot hold a target: loaded as empty config without parsing.
+_TRIVIAL_CONFIG_SIZE = 2
+
 
 class BaseSSHMenuC(ABC):
     """Abstract base class with common functionality for all sshmenuc classes."""
@@ -30,13 +45,19 @@ class BaseSSHMenuC(ABC):
     
     @staticmethod
     def _normalize_config(data: dict) -> dict:
-        """Convert old-format config (no 'targets' key) to targets-array format.
+        """Convert alternative config layouts to targets-array format.
 
-        Old format: {"GroupName": [...], ...}
-        New format: {"targets": [{"GroupName": [...]}, ...]}
+        Old format:  {"GroupName": [...], ...}
+        Keyed format: {"targets": {"GroupName": [...], ...}}
+        New format:  {"targets": [{"GroupName": [...]}, ...]}
         """
-        if isinstance(data, dict) and "targets" not in data:
+        if not isinstance(data, dict):
+            return data
+        if "targets" not in data:
             return {"targets": [{k: v} for k, v in data.items()]}
+        targets = data["targets"]
+        if isinstance(targets, dict):
+            return {**data, "targets": [{k: v} for k, v in targets.items()]}
         return data
 
     def load_config(self):
@@ -55,15 +76,16 @@ class BaseSSHMenuC(ABC):
             # If encrypted load returns None (not ready yet), fall through to plaintext
 
         try:
-            with open(self.config_file, "r") as f:
-                data = json.load(f)
-                if isinstance(data, dict) and "targets" not in data:
-                    targets = []
-                    for k, v in data.items():
-                        targets.append({k: v})
-                    self.config_data = {"targets": targets}
-                else:
-                    self.config_data = data
+            path, stat_key = self._config_stat_key()
+            cached = _CONFIG_CACHE.get(path)
+            if cached is not None and cached[0] == stat_key:
+                self.config_data = serialization.restore(cached[1])
+                return
+            if stat_key[1] <= _TRIVIAL_CONFIG_SIZE:
+                self.config_data = {"targets": []}
+            else:
+                data = serialization.load_file(self.config_file)
+                self.config_data = self._normalize_config(data)
         except FileNotFoundError:
             self._create_config_directory()
             self.config_data = {"targets": []}
@@ -72,6 +94,17 @@ class BaseSSHMenuC(ABC):
             self.config_data = {"targets": []}
         else:
             self._validate_host_entries()
+            _CONFIG_CACHE[path] = (stat_key, serialization.snapshot(self.config_data))
+
+    def _config_stat_key(self) -> Tuple[str, Tuple[int, int]]:
+        """Return the absolute config path and its (mtime_ns, size) cache key.
+
+        Raises:
+            FileNotFoundError: If the config file does not exist
+        """
+        path = os.path.abspath(self.config_file)
+        st = os.stat(path)
+        return path, (st.st_mtime_ns, st.st_size)
     
     def _validate_host_entries(self):
         """Validate host entry fields and log warnings for invalid values.
@@ -79,19 +112,24 @@ class BaseSSHMenuC(ABC):
         Checks extra_args (shlex parseable) and port (integer 1-65535).
         Does not abort loading; only warns to allow partial use of valid entries.
         """
-        for target in self.config_data.get("targets", []):
-            if not isinstance(target, dict):
+        _dict, _list = dict, list  # Local lookups inside the nested loops
+        for target in self.config_data.get("targets", ()):
+            if not isinstance(target, _dict):
                 continue
             for entries in target.values():
-                if not isinstance(entries, list):
+                if not isinstance(entries, _list):
                     continue
                 for entry in entries:
-                    if not isinstance(entry, dict):
+                    if not isinstance(entry, _dict):
                         continue
                     friendly = entry.get("friendly", entry.get("host", "unknown"))
 
                     extra_args = entry.get("extra_args")
-                    if extra_args is not None:
+                    if extra_args is not None and not (
+                        isinstance(extra_args, str) and _SHLEX_QUOTING_CHARS.isdisjoint(extra_args)
+                    ):
+                        import shlex  # Only needed for entries that quote or escape
+
                         try:
                             shlex.split(extra_args)
                         except ValueError as e:
@@ -124,8 +162,9 @@ class BaseSSHMenuC(ABC):
                 logging.error(f"Error saving config: {e}")
             return
         try:
-            with open(self.config_file, "w") as file:
-                json.dump(self.config_data, file, indent=4)
+            serialization.dump_file(self.config_data, self.config_file)
+            path, stat_key = self._config_stat_key()
+            _CONFIG_CACHE[path] = (stat_key, serialization.snapshot(self.config_data))
             self._on_config_saved()
         except Exception as e:
             logging.error(f"Error saving config: {e}")
@@ -162,15 +201,16 @@ class BaseSSHMenuC(ABC):
         Returns:
             True if at least one host entry exists, False otherwise
         """
-        targets = self.config_data.get("targets", [])
-        for t in targets:
-            if isinstance(t, dict):
-                for v in t.values():
-                    if isinstance(v, list):
-                        for item in v:
-                            if isinstance(item, dict) and ("friendly" in item or "host" in item):
-                                return True
-        return False
+        _dict, _list = dict, list  # Local lookups inside the nested scan
+        return any(
+            "friendly" in item or "host" in item
+            for t in self.config_data.get("targets", ())
+            if isinstance(t, _dict)
+            for v in t.values()
+            if isinstance(v, _list)
+            for item in v
+            if isinstance(item, _dict)
+        )
     
     @abstractmethod
     def validate_config(self) -> bool:
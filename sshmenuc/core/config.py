@@ -3,6 +3,7 @@ SSH configuration management.
 """
 from typing import List, Dict, Any, Optional, Tuple
 from .base import BaseSSHMenuC
+from ..utils.helpers import key_at
 
 
 class ConnectionManager(BaseSSHMenuC):
@@ -13,6 +14,9 @@ class ConnectionManager(BaseSSHMenuC):
 
     def __init__(self, config_file: Optional[str] = None):
         super().__init__(config_file)
+        # Name -> target lookup over config_data["targets"], built lazily:
+        # (targets list it indexes, its length when built, index)
+        self._target_index: Optional[Tuple[list, int, Dict[str, Dict[str, Any]]]] = None
         if config_file:
             self.load_config()
 
@@ -36,11 +40,41 @@ class ConnectionManager(BaseSSHMenuC):
         Returns:
             Target dictionary if found, None otherwise
         """
-        for target in self.config_data["targets"]:
-            if self._get_target_key(target) == target_name:
-                return target
+        target = self._targets_by_name().get(target_name)
+        if target is not None and target_name in target:
+            return target
         return None
 
+    def has_target(self, target_name: str) -> bool:
+        """Check whether a top-level target exists, using the name index.
+
+        Args:
+            target_name: Name of the target
+
+        Returns:
+            True if the target exists, False otherwise
+        """
+        return self._find_target(target_name) is not None
+
+    def _targets_by_name(self) -> Dict[str, Dict[str, Any]]:
+        """Return the name -> target index, rebuilding it when the targets list changed.
+
+        The targets list stays the source of truth. The index is rebuilt when
+        config_data["targets"] is replaced or its length changes; renames and
+        deletions made through this class drop it explicitly.
+
+        Returns:
+            Dictionary mapping each target name to its first target dict
+        """
+        targets = self.config_data["targets"]
+        cached = self._target_index
+        if cached is None or cached[0] is not targets or cached[1] != len(targets):
+            index: Dict[str, Dict[str, Any]] = {}
+            for target in targets:
+                index.setdefault(self._get_target_key(target), target)
+            cached = self._target_index = (targets, len(targets), index)
+        return cached[2]
+
     def validate_config(self) -> bool:
         """Validate the configuration structure.
 
@@ -63,7 +97,11 @@ class ConnectionManager(BaseSSHMenuC):
             connections: List of connection configuration dictionaries
         """
         target = {target_name: connections}
-        self.config_data["targets"].append(target)
+        targets = self.config_data["targets"]
+        index = self._targets_by_name()
+        targets.append(target)
+        index.setdefault(target_name, target)
+        self._target_index = (targets, len(targets), index)
     
     def modify_target(self, target_name: str, new_target_name: str = None,
                      connections: List[Dict[str, Any]] = None):
@@ -78,6 +116,7 @@ class ConnectionManager(BaseSSHMenuC):
         if target:
             if new_target_name:
                 target[new_target_name] = target.pop(target_name)
+                self._target_index = None
             if connections:
                 key = self._get_target_key(target)
                 target[key] = connections
@@ -92,6 +131,7 @@ class ConnectionManager(BaseSSHMenuC):
             target for target in self.config_data["targets"]
             if self._get_target_key(target) != target_name
         ]
+        self._target_index = None
     
     def create_connection(self, target_name: str, friendly: str, host: str,
                          connection_type: str = "ssh", command: str = "ssh",
@@ -115,9 +155,23 @@ class ConnectionManager(BaseSSHMenuC):
             "zone": zone,
             "project": project,
         }
+        self.add_connection(target_name, connection)
+
+    def add_connection(self, target_name: str, connection: Dict[str, Any]) -> bool:
+        """Append a connection dict to a target.
+
+        Args:
+            target_name: Name of the target to add the connection to
+            connection: Connection configuration dictionary
+
+        Returns:
+            True if added, False if the target does not exist
+        """
         target = self._find_target(target_name)
-        if target:
-            target[target_name].append(connection)
+        if target is None:
+            return False
+        target[target_name].append(connection)
+        return True
     
     def modify_connection(self, target_name: str, connection_index: int, **kwargs):
         """Modify an existing connection.
@@ -163,9 +217,9 @@ class ConnectionManager(BaseSSHMenuC):
         cur: Any = aggregated
         for item in path:
             if isinstance(cur, dict):
-                keys = list(cur.keys())
-                if 0 <= item < len(keys):
-                    cur = cur[keys[item]]
+                key = key_at(cur, item)
+                if key is not None:
+                    cur = cur[key]
                 else:
                     return cur
             elif isinstance(cur, list):
@@ -229,28 +283,25 @@ class ConnectionManager(BaseSSHMenuC):
         results: List[Tuple[str, Dict[str, Any]]] = []
         q = query.lower()
 
-        def _walk(node: Any, path_names: List[str]) -> None:
+        # Depth-first walk with an explicit stack: (node, group names, is list item).
+        # Children are pushed in reverse so results keep the config order.
+        stack: List[Tuple[Any, Tuple[str, ...], bool]] = [
+            (t, (), False) for t in reversed(self.config_data.get("targets", [])) if isinstance(t, dict)
+        ]
+        while stack:
+            node, path_names, in_list = stack.pop()
             if isinstance(node, dict):
-                for k, v in node.items():
-                    _walk(v, path_names + [k])
+                if in_list and ("friendly" in node or "host" in node):
+                    # Host entry: check match
+                    friendly = node.get("friendly", "")
+                    host = node.get("host", "")
+                    tags = node.get("tags", [])
+                    if (q in friendly.lower() or q in host.lower()
+                            or any(q in t.lower() for t in tags)):
+                        results.append((" > ".join(path_names), node))
+                else:
+                    # Target or subgroup dict
+                    stack.extend((v, path_names + (k,), False) for k, v in reversed(node.items()))
             elif isinstance(node, list):
-                for item in node:
-                    if isinstance(item, dict):
-                        if "friendly" in item or "host" in item:
-                            # Host entry: check match
-                            friendly = item.get("friendly", "")
-                            host = item.get("host", "")
-                            tags = item.get("tags", [])
-                            if (q in friendly.lower() or q in host.lower()
-                                    or any(q in t.lower() for t in tags)):
-                                breadcrumb = " > ".join(path_names)
-                                results.append((breadcrumb, item))
-                        else:
-                            # Subgroup dict
-                            _walk(item, path_names)
-
-        targets = self.config_data.get("targets", [])
-        for t in targets:
-            if isinstance(t, dict):
-                _walk(t, [])
+                stack.extend((item, path_names, True) for item in reversed(node) if isinstance(item, dict))
         return results
\ No newline at end of file
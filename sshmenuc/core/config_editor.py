@@ -1,9 +1,10 @@
 """
 Interactive configuration editor for managing targets and connections.
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List
 from clint.textui import puts, colored
 from .config import ConnectionManager
+from ..ui.keyboard import one_char_prompt
 
 
 class ConfigEditor:
@@ -45,8 +46,23 @@ class ConfigEditor:
         Returns:
             True if user confirms, False otherwise
         """
-        response = input(f"{message} [y/N]: ").strip().lower()
-        return response == 'y'
+        return one_char_prompt(f"{message} [y/N]: ").lower() == 'y'
+
+    @staticmethod
+    def _unchanged(connection: Dict[str, Any], edited: Dict[str, Any]) -> bool:
+        """Check whether edited form values match a stored connection.
+
+        Empty values and missing keys are treated as equal, as the forms do
+        when saving.
+
+        Args:
+            connection: Current connection data
+            edited: Field name -> value entered in the form
+
+        Returns:
+            True if saving would not change the connection
+        """
+        return all((connection.get(field) or None) == (value or None) for field, value in edited.items())
 
     def add_target(self) -> bool:
         """Interactive form to add a new target.
@@ -62,7 +78,7 @@ class ConfigEditor:
             return False
 
         # Check if target already exists
-        if self.manager._find_target(target_name):
+        if self.manager.has_target(target_name):
             puts(colored.red(f"Target '{target_name}' already exists"))
             return False
 
@@ -106,7 +122,7 @@ class ConfigEditor:
             return False
 
         # Check if new name already exists
-        if self.manager._find_target(new_name):
+        if self.manager.has_target(new_name):
             puts(colored.red(f"Target '{new_name}' already exists"))
             return False
 
@@ -158,9 +174,7 @@ class ConfigEditor:
         if tags:
             connection["tags"] = tags
 
-        target = self.manager._find_target(target_name)
-        if target:
-            target[target_name].append(connection)
+        if self.manager.add_connection(target_name, connection):
             self.manager.save_config()
             puts(colored.green(f"✓ Connection '{friendly}' added to '{target_name}'"))
             return True
@@ -194,6 +208,12 @@ class ConfigEditor:
             puts(colored.red("Friendly name and host cannot be empty"))
             return False
 
+        edited = {"friendly": friendly, "host": host, "user": user, "certkey": certkey,
+                  "extra_args": extra_args, "tags": tags}
+        if self._unchanged(connection, edited):
+            puts(colored.yellow("No changes"))
+            return False
+
         self.manager.modify_connection(
             target_name, connection_index,
             friendly=friendly, host=host, user=user or None, certkey=certkey or None
@@ -330,6 +350,12 @@ class ConfigEditor:
             puts(colored.red("Friendly name and host cannot be empty"))
             return False
 
+        edited = {"friendly": friendly, "host": host, "user": user, "certkey": certkey,
+                  "extra_args": extra_args, "tags": tags}
+        if self._unchanged(connection, edited):
+            puts(colored.yellow("No changes"))
+            return False
+
         node = self.manager.get_node_at_path(path)
         if isinstance(node, list) and 0 <= index < len(node):
             node[index].update({
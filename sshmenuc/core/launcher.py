@@ -1,22 +1,109 @@
 """
 SSH connection launching management.
 """
-import os
 import re
-import shlex
 import shutil
 import subprocess
 import time
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import readchar
 import logging
-from clint.textui import puts, colored
 
-from ..utils.helpers import get_current_user
+from ..ui.keyboard import one_char_prompt
+from ..utils.helpers import get_entry_user
 
 
 # Constants
 MAX_TMUX_PANES = 6  # Maximum number of tmux panes for group connections
+_SESSION_NAME_RE = re.compile(r"[^A-Za-z0-9_-]+")  # Characters not allowed in tmux session names
+
+# ASCII fast path of the same substitution: bytes.translate() marks every
+# disallowed byte with NUL, runs of marks are collapsed, then marks become "-".
+_SESSION_NAME_ALLOWED = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-")
+_SESSION_NAME_TABLE = bytes(c if c in _SESSION_NAME_ALLOWED else 0 for c in range(256))
+_SESSION_NAME_MARK_RUN = re.compile(b"\x00{2,}")
+
+# Single-key answers that accept the default (attach) at the session prompt
+_ATTACH_DEFAULT_KEYS = frozenset((readchar.key.ENTER, readchar.key.CR, readchar.key.LF))
+
+_TMUX_VERSION_RE = re.compile(r"(\d+)\.(\d+)")  # "tmux 3.3a", "tmux next-3.4"
+
+# First tmux versions with the features used below
+TMUX_ARGV_COMMANDS = (3, 0)  # Several command arguments, run without a shell
+TMUX_SESSION_FILTER = (3, 1)  # list-sessions -f
+
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+@lru_cache(maxsize=1)
+def _tmux_info() -> Tuple[Optional[str], Optional[Tuple[int, int]]]:
+    """Locate tmux and read its version, once per process.
+
+    Returns:
+        (path, (major, minor)). path is None if tmux is not installed; the
+        version is None if "tmux -V" could not be run or parsed
+    """
+    path = shutil.which("tmux")
+    if path is None:
+        return None, None
+    try:
+        res = subprocess.run([path, "-V"], capture_output=True, text=True)
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.debug(f"Failed to read tmux version: {e}")
+        return path, None
+    match = _TMUX_VERSION_RE.search(res.stdout or "")
+    return path, (int(match[1]), int(match[2])) if match else None
+
+
+def _session_suffix() -> str:
+    """Return a short unique suffix for new session names.
+
+    The current time in milliseconds, in base 36: 8 characters instead of
+    the 10 decimal digits of a seconds timestamp, and two sessions opened
+    on the same host in the same second no longer get the same name.
+    """
+    n = time.time_ns() // 1_000_000
+    digits = []
+    while n:
+        n, r = divmod(n, 36)
+        digits.append(_BASE36_DIGITS[r])
+    return "".join(reversed(digits)) or "0"
+
+
+def _tmux_supports(feature: Tuple[int, int]) -> bool:
+    """Check whether the installed tmux has a feature.
+
+    Args:
+        feature: First version providing it (e.g. TMUX_SESSION_FILTER)
+
+    Returns:
+        True if tmux is at least that version. Unparsable versions (source
+        builds such as "tmux master") are assumed to be recent.
+    """
+    version = _tmux_info()[1]
+    return version is None or version >= feature
+
+
+def _tmux_command_args(argv: List[str]) -> List[str]:
+    """Return argv as the command arguments of a tmux command.
+
+    After "--" tmux executes the arguments directly, without a shell, so no
+    quoting is needed. A trailing ";" would still end the tmux command, so
+    it is escaped as "\\;". tmux before 3.0 takes a single shell command
+    string instead.
+
+    Args:
+        argv: Program and arguments to run in the new pane or session
+
+    Returns:
+        Arguments to append to new-session or split-window
+    """
+    if not _tmux_supports(TMUX_ARGV_COMMANDS):
+        import shlex
+
+        return [" ".join(map(shlex.quote, argv))]
+    return ["--", *(arg[:-1] + "\\;" if arg.endswith(";") else arg for arg in argv)]
 
 
 class SSHLauncher:
@@ -32,7 +119,8 @@ class SSHLauncher:
         self.identity_file = identity_file
         self.extra_args = extra_args
     
-    def _sanitize_session_name(self, raw: str) -> str:
+    @staticmethod
+    def _sanitize_session_name(raw: str) -> str:
         """Sanitize tmux session name by removing invalid characters.
 
         Args:
@@ -41,25 +129,37 @@ class SSHLauncher:
         Returns:
             Sanitized session name safe for tmux
         """
-        return re.sub(r"[^A-Za-z0-9_-]+", "-", raw)
+        if not raw.isascii():
+            return _SESSION_NAME_RE.sub("-", raw)
+        marked = raw.encode("ascii").translate(_SESSION_NAME_TABLE)
+        if b"\x00\x00" in marked:
+            marked = _SESSION_NAME_MARK_RUN.sub(b"\x00", marked)
+        return marked.replace(b"\x00", b"-").decode("ascii")
     
-    def _list_tmux_sessions(self) -> List[str]:
+    def _list_tmux_sessions(self, prefix: str = "") -> List[str]:
         """List existing tmux sessions.
 
+        Args:
+            prefix: Only list sessions whose name starts with it. tmux filters
+                server-side (list-sessions -f, tmux >= 3.1); with older
+                versions the names are filtered here. Must be a sanitized
+                session name, so it holds no glob or format characters.
+
         Returns:
             List of tmux session names, empty list if tmux not available
         """
+        # "-F #S" prints bare session names, one per line
+        cmd = ["tmux", "list-sessions", "-F", "#S"]
+        server_filter = bool(prefix) and _tmux_supports(TMUX_SESSION_FILTER)
+        if server_filter:
+            cmd += ["-f", f"#{{m:{prefix}*,#S}}"]
         try:
-            res = subprocess.run(["tmux", "ls"], capture_output=True, text=True)
+            res = subprocess.run(cmd, capture_output=True, text=True)
             if res.returncode != 0:
                 return []
-            lines = [l.strip() for l in res.stdout.splitlines() if l.strip()]
-            sessions = []
-            for line in lines:
-                parts = line.split(":", 1)
-                if parts:
-                    sessions.append(parts[0])
-            return sessions
+            if server_filter:
+                return [name for name in res.stdout.split("\n") if name]
+            return [name for name in res.stdout.split("\n") if name and name.startswith(prefix)]
         except (FileNotFoundError, PermissionError, subprocess.SubprocessError) as e:
             logging.debug(f"Failed to list tmux sessions: {e}")
             return []
@@ -70,13 +170,11 @@ class SSHLauncher:
         Returns:
             List of command arguments for subprocess
         """
-        ssh_command = ["ssh"]
-        if self.identity_file:
-            ssh_command.extend(["-i", self.identity_file])
-        ssh_command.extend([f"{self.username}@{self.host}", "-p", str(self.port)])
-        if self.extra_args:
-            ssh_command.extend(shlex.split(self.extra_args))
-        return ssh_command
+        import shlex
+
+        identity = ("-i", self.identity_file) if self.identity_file else ()
+        extra = shlex.split(self.extra_args) if self.extra_args else ()
+        return ["ssh", *identity, f"{self.username}@{self.host}", "-p", str(self.port), *extra]
     
     def _handle_existing_sessions(self, sanitized_host: str) -> bool:
         """Handle existing tmux sessions with user prompt.
@@ -87,15 +185,14 @@ class SSHLauncher:
         Returns:
             True if attached to existing session, False otherwise
         """
-        existing = self._list_tmux_sessions()
-        matches = [s for s in existing if s.startswith(f"{sanitized_host}-")]
+        matches = self._list_tmux_sessions(f"{sanitized_host}-")
         
         if not matches:
             return False
         
         if len(matches) == 1:
-            choice = input(f"Found tmux session '{matches[0]}'. Attach (a) or create new (n)? [a/n]: ").strip().lower()
-            if choice == "a" or choice == "":
+            choice = one_char_prompt(f"Found tmux session '{matches[0]}'. Attach (a) or create new (n)? [a/n]: ")
+            if choice.lower() == "a" or choice in _ATTACH_DEFAULT_KEYS:
                 tmux_cmd = ["tmux", "attach-session", "-t", matches[0]]
                 subprocess.run(tmux_cmd)
                 return True
@@ -119,10 +216,9 @@ class SSHLauncher:
         Args:
             ssh_command: SSH command arguments list
         """
-        session_raw = f"{self.host}-{int(time.time())}"
+        session_raw = f"{self.host}-{_session_suffix()}"
         session = self._sanitize_session_name(session_raw)
-        ssh_cmd_str = " ".join(shlex.quote(p) for p in ssh_command)
-        tmux_cmd = ["tmux", "new-session", "-s", session, ssh_cmd_str]
+        tmux_cmd = ["tmux", "new-session", "-s", session, *_tmux_command_args(ssh_command)]
         subprocess.run(tmux_cmd)
     
     def launch(self):
@@ -134,7 +230,7 @@ class SSHLauncher:
         ssh_command = self._build_ssh_command()
         
         try:
-            if shutil.which("tmux"):
+            if _tmux_info()[0]:
                 sanitized_host = self._sanitize_session_name(self.host)
                 
                 # Try to attach to existing sessions
@@ -159,7 +255,9 @@ class SSHLauncher:
         Args:
             host_entries: List of host entry dictionaries with connection details
         """
-        if not shutil.which("tmux"):
+        from clint.textui import puts, colored  # Only this method prints colored output
+
+        if not _tmux_info()[0]:
             puts(colored.red("tmux not found; cannot open grouped session"))
             return
         
@@ -173,32 +271,35 @@ class SSHLauncher:
             host_entries = host_entries[:MAX_TMUX_PANES]
         
         # Session name based on first host + timestamp
-        session_raw = f"{host_entries[0]['host']}-{int(time.time())}"
-        session = re.sub(r"[^A-Za-z0-9_-]+", "-", session_raw)
+        session_raw = f"{host_entries[0]['host']}-{_session_suffix()}"
+        session = SSHLauncher._sanitize_session_name(session_raw)
         
+        import shlex
+
         # Build SSH commands
         ssh_cmds = []
         for he in host_entries:
-            cmd = ["ssh"]
             identity = he.get("identity") or he.get("certkey")
-            if identity:
-                cmd.extend(["-i", identity])
-            user = he.get("user", get_current_user())
-            cmd.append(f"{user}@{he['host']}")
+            user = get_entry_user(he)
             extra_args = he.get("extra_args")
-            if extra_args:
-                cmd.extend(shlex.split(extra_args))
-            ssh_cmds.append(" ".join(shlex.quote(p) for p in cmd))
+            cmd = [
+                "ssh",
+                *(("-i", identity) if identity else ()),
+                f"{user}@{he['host']}",
+                *(shlex.split(extra_args) if extra_args else ()),
+            ]
+            ssh_cmds.append(_tmux_command_args(cmd))
         
+        # One tmux client builds the whole session: a ";" argument separates
+        # commands, so the splits and the layout need no extra processes.
+        setup = ["tmux", "new-session", "-s", session, "-d", *ssh_cmds[0]]
+        for cmd in ssh_cmds[1:]:
+            setup += [";", "split-window", "-t", session, *cmd]
+        setup += [";", "select-layout", "-t", session, "tiled"]
+
         try:
-            # Create detached session with first command
-            subprocess.run(["tmux", "new-session", "-s", session, "-d", ssh_cmds[0]])
-            # Create splits for the rest
-            for cmd in ssh_cmds[1:]:
-                subprocess.run(["tmux", "split-window", "-t", session, cmd])
-            # Organize layout
-            subprocess.run(["tmux", "select-layout", "-t", session, "tiled"])
-            # Attach session
+            subprocess.run(setup)
+            # Attach session (blocks until detach or exit)
             subprocess.run(["tmux", "attach-session", "-t", session])
         except Exception as e:
             print(f"Error creating tmux session: {e}")
\ No newline at end of file
@@ -2,8 +2,11 @@
 Menu navigation management.
 """
 import os
+import sys
 import logging
-from typing import List, Any, Dict, Optional, Union
+from collections import deque
+from contextlib import nullcontext
+from typing import List, Any, Dict, Optional, Tuple, Union
 import readchar
 from clint.textui import puts, colored
 
@@ -12,13 +15,37 @@ from .launcher import SSHLauncher
 from .config import ConnectionManager
 from .config_editor import ConfigEditor
 from ..ui.display import MenuDisplay
-from ..utils.helpers import get_current_user
+from ..ui.keyboard import cbreak, cooked, read_keys
+from ..utils.helpers import get_entry_user, key_at
 from ..sync import SyncManager, SyncState
 
 
 # Constants
 MAX_MARKED_SELECTIONS = 6  # Maximum number of hosts that can be marked for multi-connection
 
+# Keys compared on every keypress, bound once instead of looked up on readchar.key
+KEY_UP = readchar.key.UP
+KEY_DOWN = readchar.key.DOWN
+KEY_LEFT = readchar.key.LEFT
+KEY_ENTER = readchar.key.ENTER
+
+# Key sets checked on every keypress, built once
+ARROW_KEYS = frozenset((KEY_UP, KEY_DOWN))
+REPAINT_KEYS = ARROW_KEYS | {" "}  # Keys that only change row highlighting
+QUEUE_SAFE_KEYS = frozenset(("q", " ", "/", KEY_ENTER, KEY_LEFT))  # Keys whose handlers don't prompt
+CONFIRM_KEYS = frozenset(("y", "Y"))
+BACKSPACE_KEYS = frozenset(("\x7f", "\x08"))
+
+
+def _emit(*lines: Any) -> None:
+    """Print several lines with a single write, like consecutive puts() calls.
+
+    Args:
+        *lines: Lines to print, plain or clint colored strings
+    """
+    sys.stdout.write("".join(f"{line}\n" for line in lines))
+    sys.stdout.flush()
+
 
 class ConnectionNavigator(BaseSSHMenuC):
     """Manages navigation through the connection menu.
@@ -32,6 +59,7 @@ class ConnectionNavigator(BaseSSHMenuC):
         super().__init__(config_file)
         self.load_config()
         self.marked_indices = set()
+        self._pending_keys = deque()  # Keys read in the same burst, not yet handled
         self.display = MenuDisplay()
         self.config_manager = ConnectionManager(config_file)
         self.editor = ConfigEditor(self.config_manager)
@@ -40,7 +68,7 @@ class ConnectionNavigator(BaseSSHMenuC):
         self._active_context = active_context
         # Sync setup: install post-save hook and run startup pull
         self.sync_manager = SyncManager(config_file, sync_cfg_override=sync_cfg_override)
-        self.config_manager._post_save_hook = lambda: self.sync_manager.post_save_push()
+        self.config_manager._post_save_hook = self.sync_manager.post_save_push
         # In multi-context mode, wire the metadata callback so SyncManager can
         # persist last_sync/last_config_hash to contexts.json via ContextManager.
         if context_manager is not None and active_context:
@@ -62,8 +90,7 @@ class ConnectionNavigator(BaseSSHMenuC):
             self.config_manager.set_config(data)
         elif state == SyncState.SYNC_OK:
             # Backward compat: no in-memory data (e.g. first run, no .enc yet)
-            self.load_config()
-            self.config_manager.load_config()
+            self._reload_config()
         if state == SyncState.SYNC_OFFLINE:
             puts(colored.yellow("[SYNC] Remote non raggiungibile - uso backup locale criptato"))
         elif state == SyncState.LOCAL_ONLY:
@@ -106,6 +133,69 @@ class ConnectionNavigator(BaseSSHMenuC):
             except OSError as e:
                 logging.warning("[SYNC] Cannot remove plaintext config: %s", e)
 
+    def load_config(self):
+        """Load the configuration and drop values derived from the previous one."""
+        super().load_config()
+        self._invalidate_caches()
+
+    def set_config(self, config_data: Dict[str, Any]):
+        """Set a new configuration and drop values derived from the previous one."""
+        super().set_config(config_data)
+        self._invalidate_caches()
+
+    def _reload_config(self) -> None:
+        """Reload the config once and hand the parsed data to the connection manager.
+
+        Both objects read the same source, so parsing it a second time for
+        config_manager would only repeat the work.
+        """
+        self.load_config()
+        self.config_manager.set_config(self.config_data)
+
+    def _invalidate_caches(self) -> None:
+        """Reset the per-config render caches.
+
+        Must run whenever config_data is replaced or reloaded after an edit.
+        """
+        self._breadcrumb_cache: Dict[tuple, str] = {}
+        self._last_frame: Optional[tuple] = None
+        # (config_data, merged targets, their keys); rebuilt if config_data is replaced
+        self._aggregated: Optional[Tuple[Any, Dict[str, Any], Tuple[str, ...]]] = None
+        self._node_cache: Dict[tuple, Any] = {}  # get_node() results by path
+        self._view_cache: Dict[tuple, Tuple[Any, int, int]] = {}  # See _view()
+
+    def _aggregated_targets(self) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+        """Return the top-level targets merged into one dict, and its keys.
+
+        Computed once per loaded config instead of on every get_node() call.
+
+        Returns:
+            (aggregated targets, tuple of their names in menu order)
+        """
+        cached = self._aggregated
+        config_data = self.config_data
+        if cached is None or cached[0] is not config_data:
+            aggregated: Dict[str, Any] = {}
+            for t in config_data.get("targets", []):
+                if isinstance(t, dict):
+                    aggregated.update(t)
+            cached = self._aggregated = (config_data, aggregated, tuple(aggregated))
+            self._node_cache.clear()
+            self._view_cache.clear()
+        return cached[1], cached[2]
+
+    def _target_name(self, index: int) -> Optional[str]:
+        """Return the name of the top-level target at a menu position.
+
+        Args:
+            index: Position in the root menu
+
+        Returns:
+            The target name, or None if index is out of range
+        """
+        names = self._aggregated_targets()[1]
+        return names[index] if 0 <= index < len(names) else None
+
     def validate_config(self) -> bool:
         """Validate the configuration for navigation.
 
@@ -125,59 +215,104 @@ class ConnectionNavigator(BaseSSHMenuC):
         """
         current_path = []
         selected_target = 0
-        
-        while True:
-            num_targets = self.count_elements(current_path)
-            self.print_menu(selected_target, current_path)
-            key = readchar.readkey()
+        # Key -> handler, looked up once per keystroke instead of an elif chain
+        path_handlers = {
+            " ": self._handle_selection,
+            "a": self._handle_add,
+            "e": self._handle_edit,
+            "d": self._handle_delete,
+            "r": self._handle_rename,
+        }
+        plain_handlers = {
+            "s": self._handle_sync_status,
+            "x": self._handle_context_switch,
+            "/": self._search_mode,
+        }
+        if self._context_manager is not None:
+            plain_handlers["c"] = self._handle_context_manage
+        handled_keys = frozenset(("q", KEY_LEFT, KEY_ENTER, *ARROW_KEYS, *path_handlers, *plain_handlers))
+
+        # Held for the whole session, so keys typed while the menu is drawn
+        # are not echoed; prompting handlers and launches switch to cooked()
+        with cbreak():
+            while True:
+                num_targets = self.count_elements(current_path)
+                self.print_menu(selected_target, current_path)
+                key = self._next_key()
+                while key not in handled_keys:
+                    key = self._next_key()  # Unbound key: nothing changed, nothing to redraw
+                if key not in REPAINT_KEYS:
+                    # Anything else may print below the table: force a full redraw
+                    self._last_frame = None
+                if key not in QUEUE_SAFE_KEYS:
+                    # Handlers prompting with input() must not act on stale type-ahead
+                    self._pending_keys.clear()
             
-            if key == "q":
-                sync_active = bool(self.sync_manager._sync_cfg.get("remote_url"))
-                prompt = "Uscire? [y/N]"
-                if sync_active:
-                    prompt += " — al prossimo avvio verrà richiesta la password di decrypt"
-                puts(colored.yellow(prompt))
-                confirm = readchar.readkey()
-                if confirm in ("y", "Y"):
-                    break
-            elif key == readchar.key.DOWN:
+                if key == "q":
+                    sync_active = bool(self.sync_manager._sync_cfg.get("remote_url"))
+                    prompt = "Uscire? [y/N]"
+                    if sync_active:
+                        prompt += " — al prossimo avvio verrà richiesta la password di decrypt"
+                    puts(colored.yellow(prompt))
+                    confirm = self._next_key()
+                    if confirm in CONFIRM_KEYS:
+                        break
+                elif key in ARROW_KEYS:
+                    selected_target = self._move_selection(key, selected_target, num_targets)
+                elif key == KEY_LEFT:
+                    self.marked_indices.clear()
+                    self.move_left(current_path)
+                    selected_target = 0
+                else:
+                    try:
+                        if key == KEY_ENTER:
+                            prev_path = list(current_path)
+                            self._handle_enter(current_path, selected_target)
+                            if current_path != prev_path:
+                                selected_target = 0
+                        else:
+                            # Handlers outside QUEUE_SAFE_KEYS prompt with input()
+                            with nullcontext() if key in QUEUE_SAFE_KEYS else cooked():
+                                if key in path_handlers:
+                                    path_handlers[key](current_path, selected_target)
+                                else:
+                                    plain_handlers[key]()
+                    except KeyboardInterrupt:
+                        pass  # Ctrl+C cancels the current operation, returns to menu
+
+    def _next_key(self) -> str:
+        """Return the next key, reading a new burst from the terminal when none is queued."""
+        if not self._pending_keys:
+            self._pending_keys.extend(read_keys())
+        return self._pending_keys.popleft()
+
+    def _move_selection(self, key: str, selected_target: int, num_targets: int) -> int:
+        """Apply an UP/DOWN key plus any arrow keys queued right behind it.
+
+        Key repeat and fast typing deliver several arrows per read: they are
+        all applied before the next redraw, so only the final position is drawn.
+        Keys typed meanwhile are picked up without blocking before returning.
+
+        Args:
+            key: KEY_UP or KEY_DOWN
+            selected_target: Currently selected target index
+            num_targets: Number of items in the current node
+
+        Returns:
+            The new selected target index
+        """
+        while True:
+            if key == KEY_DOWN:
                 if selected_target < num_targets - 1 or num_targets == 0:
                     selected_target += 1
-            elif key == readchar.key.UP:
-                if selected_target > 0:
-                    selected_target -= 1
-            elif key == readchar.key.LEFT:
-                self.marked_indices.clear()
-                self.move_left(current_path)
-                selected_target = 0
-            else:
-                try:
-                    if key == " ":
-                        self._handle_selection(current_path, selected_target)
-                    elif key == readchar.key.ENTER:
-                        prev_path = list(current_path)
-                        self._handle_enter(current_path, selected_target)
-                        if current_path != prev_path:
-                            selected_target = 0
-                    elif key == "a":
-                        self._handle_add(current_path, selected_target)
-                    elif key == "e":
-                        self._handle_edit(current_path, selected_target)
-                    elif key == "d":
-                        self._handle_delete(current_path, selected_target)
-                    elif key == "r":
-                        self._handle_rename(current_path, selected_target)
-                    elif key == "s":
-                        self._handle_sync_status()
-                    elif key == "x":
-                        self._handle_context_switch()
-                    elif key == "c" and self._context_manager is not None:
-                        self._handle_context_manage()
-                    elif key == "/":
-                        self._search_mode()
-                except KeyboardInterrupt:
-                    pass  # Ctrl+C cancels the current operation, returns to menu
-    
+            elif selected_target > 0:
+                selected_target -= 1
+            if not self._pending_keys:
+                self._pending_keys.extend(read_keys(wait=False))
+            if not self._pending_keys or self._pending_keys[0] not in ARROW_KEYS:
+                return selected_target
+            key = self._pending_keys.popleft()
+
     def _handle_selection(self, current_path: List[Any], selected_target: int):
         """Handle selection toggle with space key.
 
@@ -194,6 +329,7 @@ class ConnectionNavigator(BaseSSHMenuC):
                     self.marked_indices.add(selected_target)
                 else:
                     puts(colored.red(f"Maximum {MAX_MARKED_SELECTIONS} selections allowed"))
+                    self._last_frame = None  # The message moved the cursor
     
     def _handle_enter(self, current_path: List[Any], selected_target: int):
         """Handle enter key press.
@@ -221,13 +357,15 @@ class ConnectionNavigator(BaseSSHMenuC):
                 item = node[i]
                 if isinstance(item, dict) and ("host" in item or "friendly" in item):
                     host = item.get("host", item.get("friendly"))
-                    user = item.get("user", get_current_user())
+                    user = get_entry_user(item)
                     ident = item.get("certkey", item.get("identity_file", None))
                     extra_args = item.get("extra_args")
                     selected_hosts.append({"host": host, "user": user, "identity": ident, "extra_args": extra_args})
         
         if selected_hosts:
-            SSHLauncher.launch_group(selected_hosts)
+            self._pending_keys.clear()  # Type-ahead must not replay after the session ends
+            with cooked():  # ssh/tmux and the attach prompt need the normal terminal mode
+                SSHLauncher.launch_group(selected_hosts)
             self.marked_indices.clear()
         else:
             puts(colored.red("No valid hosts selected"))
@@ -241,14 +379,17 @@ class ConnectionNavigator(BaseSSHMenuC):
             current_path: Current navigation path
         """
         if isinstance(node, list):
-            if "friendly" in node[selected_target]:
-                host = node[selected_target]["host"]
-                user = node[selected_target].get("user", get_current_user())
-                identity = node[selected_target].get("certkey")
-                port = node[selected_target].get("port", 22)
-                extra_args = node[selected_target].get("extra_args")
+            entry = node[selected_target]
+            if "friendly" in entry:
+                host = entry["host"]
+                user = get_entry_user(entry)
+                identity = entry.get("certkey")
+                port = entry.get("port", 22)
+                extra_args = entry.get("extra_args")
                 launcher = SSHLauncher(host, user, port, identity, extra_args)
-                launcher.launch()
+                self._pending_keys.clear()  # Type-ahead must not replay after the session ends
+                with cooked():
+                    launcher.launch()
             else:
                 current_path.extend([selected_target, 0])
         else:
@@ -257,28 +398,36 @@ class ConnectionNavigator(BaseSSHMenuC):
     def get_node(self, path: List[Any]):
         """Return the current node at the given path.
 
+        Resolved nodes are cached per path until the config is reloaded.
+
         Args:
             path: Navigation path as list of indices
 
         Returns:
             The node at the specified path (dict, list, or host entry)
         """
-        targets = self.config_data.get("targets", [])
-        aggregated: Dict[str, Any] = {}
-        for t in targets:
-            if isinstance(t, dict):
-                for k, v in t.items():
-                    aggregated[k] = v
-        
+        aggregated, names = self._aggregated_targets()
         if not path:
             return aggregated
-        
-        cur: Union[dict, list, Any] = aggregated
-        for item in path:
+        key = tuple(path)
+        try:
+            return self._node_cache[key]
+        except KeyError:
+            pass
+        node = self._node_cache[key] = self._walk(aggregated, names, path)
+        return node
+
+    @staticmethod
+    def _walk(aggregated: Dict[str, Any], names: Tuple[str, ...], path: List[Any]):
+        """Follow a non-empty path from the merged targets (see get_node())."""
+        if not 0 <= path[0] < len(names):
+            return aggregated
+
+        cur: Union[dict, list, Any] = aggregated[names[path[0]]]
+        for item in path[1:]:
             if isinstance(cur, dict):
-                keys = list(cur.keys())
-                if 0 <= item < len(keys):
-                    key = keys[item]
+                key = key_at(cur, item)
+                if key is not None:
                     cur = cur[key]
                 else:
                     return cur
@@ -301,27 +450,14 @@ class ConnectionNavigator(BaseSSHMenuC):
             The node at path[:-1]
 
         Raises:
-            KeyError: If a key in the path is not found
             TypeError: If node type is not dict or list
         """
-        # Aggregate targets like get_node() does
-        targets = self.config_data.get("targets", [])
-        aggregated: Dict[str, Any] = {}
-        for t in targets:
-            if isinstance(t, dict):
-                for k, v in t.items():
-                    aggregated[k] = v
-
-        node: Union[dict, list] = aggregated  # Start from aggregated
+        node: Union[dict, list] = self._aggregated_targets()[0]  # Start from aggregated
         for item in path[:-1]:
             if isinstance(node, dict):
-                keys = list(node.keys())
-                if 0 <= item < len(keys):
-                    key = keys[item]
-                    if key in node:
-                        node = node[key]
-                    else:
-                        raise KeyError(f"Key '{key}' not found in dictionary.")
+                key = key_at(node, item)
+                if key is not None:
+                    node = node[key]
             elif isinstance(node, list):
                 if item < len(node):
                     node = node[item]
@@ -333,23 +469,30 @@ class ConnectionNavigator(BaseSSHMenuC):
         """Build a human-readable path string for the current position.
 
         Returns empty string at root, e.g. "HDP > Prod > Admin" at depth 3.
+        The result is cached per path until the config is reloaded.
         """
         if not path:
             return ""
+        key = tuple(path)
+        cached = self._breadcrumb_cache.get(key)
+        if cached is not None:
+            return cached
         parts = []
         for depth in range(len(path)):
             node = self.get_node(path[:depth])
             idx = path[depth]
             if isinstance(node, dict):
-                keys = list(node.keys())
-                if 0 <= idx < len(keys):
-                    parts.append(keys[idx])
+                key = key_at(node, idx)
+                if key is not None:
+                    parts.append(key)
             elif isinstance(node, list):
                 if 0 <= idx < len(node):
                     item = node[idx]
                     if isinstance(item, dict) and "friendly" not in item and "host" not in item:
                         parts.append(next(iter(item.keys()), "?"))
-        return " > ".join(parts)
+        breadcrumb = " > ".join(parts)
+        self._breadcrumb_cache[key] = breadcrumb
+        return breadcrumb
 
     def count_elements(self, current_path: List[Any]) -> int:
         """Count elements in the current node.
@@ -360,13 +503,29 @@ class ConnectionNavigator(BaseSSHMenuC):
         Returns:
             Number of items in the current node
         """
-        node = self.get_node(current_path)
-        if isinstance(node, dict):
-            return len(node)
-        elif isinstance(node, list):
-            return sum(1 for item in node if isinstance(item, dict))
-        else:
-            return 0
+        return self._view(current_path)[1]
+
+    def _view(self, current_path: List[Any]) -> Tuple[Any, int, int]:
+        """Return what a menu redraw needs for a path, computed once per path.
+
+        Args:
+            current_path: Current navigation path
+
+        Returns:
+            (node, number of items, table nesting level)
+        """
+        key = tuple(current_path)
+        view = self._view_cache.get(key)
+        if view is None:
+            node = self.get_node(current_path)
+            if isinstance(node, dict):
+                view = (node, len(node), len(current_path))
+            elif isinstance(node, list):
+                view = (node, sum(1 for item in node if isinstance(item, dict)), len(current_path) + 1)
+            else:
+                view = (node, 0, len(current_path) + 1)
+            self._view_cache[key] = view
+        return view
     
     def move_left(self, current_path: List[Any]):
         """Handle left navigation (go back).
@@ -375,9 +534,10 @@ class ConnectionNavigator(BaseSSHMenuC):
             current_path: Current navigation path (modified in place)
         """
         if current_path:
-            if isinstance(self.get_node(current_path), dict):
+            node = self.get_node(current_path)
+            if isinstance(node, dict):
                 current_path.pop()
-            elif isinstance(self.get_node(current_path), list) and len(current_path) > 1:
+            elif isinstance(node, list) and len(current_path) > 1:
                 if isinstance(self.get_previous_node(current_path), dict):
                     current_path.pop()
                     current_path.pop()
@@ -391,29 +551,45 @@ class ConnectionNavigator(BaseSSHMenuC):
     def print_menu(self, selected_target: int, current_path: List[Any]):
         """Print the current menu.
 
+        When the path is unchanged since the last frame, only the rows whose
+        selection or mark state changed are repainted instead of clearing the
+        whole screen.
+
         Args:
             selected_target: Index of the currently selected item
             current_path: Current navigation path
         """
+        frame_key = tuple(current_path)
+        marks = frozenset(self.marked_indices)
+        last = self._last_frame
+        if last is not None and last[0] == frame_key:
+            rows = last[2] ^ marks  # Toggled marks
+            if last[1] != selected_target:
+                rows |= {last[1], selected_target}
+            node = self._view(current_path)[0]
+            if self.display.repaint_rows(node, rows, selected_target, self.marked_indices):
+                self._last_frame = (frame_key, selected_target, marks)
+                return
+
         self.display.clear_screen()
         self.display.print_instructions(
             sync_label=self.sync_manager.get_status_label(),
             context_label=self._active_context or "",
         )
 
-        logging.debug("selected_target: %d", selected_target)
-        logging.debug("current_path: %s", current_path)
-        
-        current_node = self.get_node(current_path)
-        logging.debug("current_node_type: %s", type(current_node))
-        logging.debug("current_node: %s", current_node)
+        current_node, _, level = self._view(current_path)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("selected_target: %d", selected_target)
+            logging.debug("current_path: %s", current_path)
+            logging.debug("current_node_type: %s", type(current_node))
+            logging.debug("current_node: %s", current_node)
 
         breadcrumb = self._build_breadcrumb(current_path)
         if breadcrumb:
             self.display.print_breadcrumb(breadcrumb)
 
-        level = len(current_path) if isinstance(current_node, dict) else len(current_path) + 1
         self.display.print_table(current_node, selected_target, self.marked_indices, level)
+        self._last_frame = (frame_key, selected_target, marks)
 
     def _handle_add(self, current_path: List[Any], selected_target: int):
         """Handle 'a' key - Add target, subgroup, or connection based on context."""
@@ -448,9 +624,8 @@ class ConnectionNavigator(BaseSSHMenuC):
         """Handle 'd' key - Delete target, subgroup, or connection based on context."""
         node = self.get_node(current_path)
         if isinstance(node, dict) and not current_path:
-            target_keys = list(node.keys())
-            if 0 <= selected_target < len(target_keys):
-                target_name = target_keys[selected_target]
+            target_name = self._target_name(selected_target)
+            if target_name is not None:
                 if self.editor.delete_target(target_name):
                     self.load_config()
                     input("\nPress Enter to continue...")
@@ -470,9 +645,8 @@ class ConnectionNavigator(BaseSSHMenuC):
         """Handle 'r' key - Rename target or subgroup."""
         node = self.get_node(current_path)
         if isinstance(node, dict) and not current_path:
-            target_keys = list(node.keys())
-            if 0 <= selected_target < len(target_keys):
-                target_name = target_keys[selected_target]
+            target_name = self._target_name(selected_target)
+            if target_name is not None:
                 if self.editor.rename_target(target_name):
                     self.load_config()
                     input("\nPress Enter to continue...")
@@ -490,38 +664,41 @@ class ConnectionNavigator(BaseSSHMenuC):
         label = self.sync_manager.get_status_label()
         cfg = self.sync_manager._sync_cfg
 
-        puts(colored.cyan("\n=== Sync Status ==="))
-        puts(colored.white(f"Stato: {label or 'NO SYNC'}"))
-
         remote_url = cfg.get("remote_url", "")
         if remote_url:
             # Mask credentials in URL for display
             display_url = remote_url.split("@")[-1] if "@" in remote_url else remote_url
-            puts(colored.white(f"Remote: {display_url}"))
+            remote_line = colored.white(f"Remote: {display_url}")
         else:
-            puts(colored.yellow("Remote: non configurato"))
+            remote_line = colored.yellow("Remote: non configurato")
 
         last_sync = cfg.get("last_sync", "mai")
-        puts(colored.white(f"Ultimo sync: {last_sync}"))
+        if state == SyncState.NO_SYNC:
+            actions = colored.white("\n[s] Configura sync remoto  [Invio] Chiudi")
+        else:
+            actions = colored.white("\n[m] Sync manuale  [Invio] Chiudi")
+        _emit(
+            colored.cyan("\n=== Sync Status ==="),
+            colored.white(f"Stato: {label or 'NO SYNC'}"),
+            remote_line,
+            colored.white(f"Ultimo sync: {last_sync}"),
+            actions,
+        )
 
         if state == SyncState.NO_SYNC:
-            puts(colored.white("\n[s] Configura sync remoto  [Invio] Chiudi"))
             choice = input("> ").strip().lower()
             if choice == "s":
                 configured = self.sync_manager.setup_wizard()
                 if configured:
                     # Reload state after wizard (may have changed to SYNC_OK/SYNC_OFFLINE)
-                    self.load_config()
-                    self.config_manager.load_config()
+                    self._reload_config()
             return
 
-        puts(colored.white("\n[m] Sync manuale  [Invio] Chiudi"))
         choice = input("> ").strip().lower()
         if choice == "m":
             puts(colored.yellow("Sync in corso..."))
             self.sync_manager.startup_pull()
-            self.load_config()
-            self.config_manager.load_config()
+            self._reload_config()
             puts(colored.green("Sync completato."))
         input("\nPress Enter to continue...")
 
@@ -559,7 +736,7 @@ class ConnectionNavigator(BaseSSHMenuC):
         self.sync_manager = temp_sm
         self.config_manager = ConnectionManager(new_config_file)
         self.editor = ConfigEditor(self.config_manager)
-        self.config_manager._post_save_hook = lambda: self.sync_manager.post_save_push()
+        self.config_manager._post_save_hook = self.sync_manager.post_save_push
         self._wire_encrypted_io()
         data = self.sync_manager.get_config_data()
         if data is not None:
@@ -567,8 +744,7 @@ class ConnectionNavigator(BaseSSHMenuC):
             self.set_config(data)
             self.config_manager.set_config(data)
         else:
-            self.load_config()
-            self.config_manager.load_config()
+            self._reload_config()
         puts(colored.green(f"[CTX] Contesto cambiato: {prev_context} → {new_name}"))
         return True
 
@@ -590,11 +766,12 @@ class ConnectionNavigator(BaseSSHMenuC):
             input("\nPress Enter to continue...")
             return
 
-        puts(colored.cyan("\n=== Switch Contesto ==="))
-        for i, name in enumerate(names, 1):
-            marker = " *" if name == self._active_context else ""
-            puts(colored.white(f"  [{i}] {name}{marker}"))
-        puts(colored.white("\n[Invio] Annulla"))
+        _emit(
+            colored.cyan("\n=== Switch Contesto ==="),
+            *(colored.white(f"  [{i}] {name}{' *' if name == self._active_context else ''}")
+              for i, name in enumerate(names, 1)),
+            colored.white("\n[Invio] Annulla"),
+        )
 
         raw = input("> ").strip()
         if not raw:
@@ -622,23 +799,23 @@ class ConnectionNavigator(BaseSSHMenuC):
         names = self._context_manager.list_contexts()
 
         # Discover unregistered .enc files from the active context's sync repo
-        active_sync_cfg = self._context_manager.get_sync_cfg(self._active_context or "")
+        active_sync_cfg = self._context_manager.get_sync_cfg(self._active_context or "", readonly=True)
         sync_repo_path = active_sync_cfg.get("sync_repo_path", "")
         discovered = self._context_manager.discover_available(sync_repo_path) if sync_repo_path else []
 
-        puts(colored.cyan("\n=== Gestione Contesti ==="))
-        puts(colored.white("  [1] Nuovo contesto"))
+        lines = [colored.cyan("\n=== Gestione Contesti ==="), colored.white("  [1] Nuovo contesto")]
         for i, name in enumerate(names, 2):
             marker = " *" if name == self._active_context else ""
-            puts(colored.white(f"  [{i}] {name}{marker}"))
+            lines.append(colored.white(f"  [{i}] {name}{marker}"))
 
         offset = len(names) + 2
         if discovered:
-            puts(colored.cyan("\n  -- Disponibili nel repo (non ancora registrati) --"))
+            lines.append(colored.cyan("\n  -- Disponibili nel repo (non ancora registrati) --"))
             for j, enc_file in enumerate(discovered, offset):
-                puts(colored.yellow(f"  [{j}] {enc_file}  (importa)"))
+                lines.append(colored.yellow(f"  [{j}] {enc_file}  (importa)"))
 
-        puts(colored.white("\n[Invio] Annulla"))
+        lines.append(colored.white("\n[Invio] Annulla"))
+        _emit(*lines)
 
         raw = input("> ").strip()
         if not raw:
@@ -667,10 +844,12 @@ class ConnectionNavigator(BaseSSHMenuC):
     def _handle_context_actions(self, name: str) -> None:
         """Sub-menu for a selected context: edit sync params or reimport from plaintext."""
         marker = " *" if name == self._active_context else ""
-        puts(colored.cyan(f"\n--- {name}{marker} ---"))
-        puts(colored.white("  [m] Modifica parametri sync"))
-        puts(colored.white("  [i] Reimport da file in chiaro"))
-        puts(colored.white("\n[Invio] Annulla"))
+        _emit(
+            colored.cyan(f"\n--- {name}{marker} ---"),
+            colored.white("  [m] Modifica parametri sync"),
+            colored.white("  [i] Reimport da file in chiaro"),
+            colored.white("\n[Invio] Annulla"),
+        )
 
         choice = input("> ").strip().lower()
         if choice == "m":
@@ -795,11 +974,13 @@ class ConnectionNavigator(BaseSSHMenuC):
         only the remote_file changes. Offers to switch immediately after import.
         """
         suggested_name = enc_file.removesuffix(".enc")
-        puts(colored.cyan(f"\n--- Importa contesto: {enc_file} ---"))
-        puts(colored.white(f"  remote_url:   {base_sync_cfg.get('remote_url', '')}"))
-        puts(colored.white(f"  branch:       {base_sync_cfg.get('branch', 'main')}"))
-        puts(colored.white(f"  remote_file:  {enc_file}"))
-        puts(colored.white(f"  sync_repo:    {base_sync_cfg.get('sync_repo_path', '')}"))
+        _emit(
+            colored.cyan(f"\n--- Importa contesto: {enc_file} ---"),
+            colored.white(f"  remote_url:   {base_sync_cfg.get('remote_url', '')}"),
+            colored.white(f"  branch:       {base_sync_cfg.get('branch', 'main')}"),
+            colored.white(f"  remote_file:  {enc_file}"),
+            colored.white(f"  sync_repo:    {base_sync_cfg.get('sync_repo_path', '')}"),
+        )
 
         name_input = input(f"\nNome contesto [{suggested_name}]: ").strip()
         name = name_input or suggested_name
@@ -842,13 +1023,15 @@ class ConnectionNavigator(BaseSSHMenuC):
         Args:
             name: Name of the context whose sync config should be updated.
         """
-        current_cfg = self._context_manager.get_sync_cfg(name)
-
-        puts(colored.cyan(f"\n--- Modifica sync: {name} ---"))
-        puts(colored.white(f"  remote_url:  {current_cfg.get('remote_url', '(non configurato)')}"))
-        puts(colored.white(f"  branch:      {current_cfg.get('branch', 'main')}"))
-        puts(colored.white(f"  remote_file: {current_cfg.get('remote_file', '(non configurato)')}"))
-        puts(colored.white("\nPremi Invio per mantenere il valore corrente.\n"))
+        current_cfg = self._context_manager.get_sync_cfg(name, readonly=True)
+
+        _emit(
+            colored.cyan(f"\n--- Modifica sync: {name} ---"),
+            colored.white(f"  remote_url:  {current_cfg.get('remote_url', '(non configurato)')}"),
+            colored.white(f"  branch:      {current_cfg.get('branch', 'main')}"),
+            colored.white(f"  remote_file: {current_cfg.get('remote_file', '(non configurato)')}"),
+            colored.white("\nPremi Invio per mantenere il valore corrente.\n"),
+        )
 
         new_url = input("Nuovo remote URL: ").strip()
         new_branch = input("Nuovo branch: ").strip()
@@ -875,7 +1058,7 @@ class ConnectionNavigator(BaseSSHMenuC):
         if name == self._active_context:
             new_cfg = self._context_manager.get_sync_cfg(name)
             self.sync_manager = SyncManager(self.config_file, sync_cfg_override=new_cfg)
-            self.config_manager._post_save_hook = lambda: self.sync_manager.post_save_push()
+            self.config_manager._post_save_hook = self.sync_manager.post_save_push
             self._wire_encrypted_io()
             puts(colored.yellow("[SYNC] SyncManager aggiornato con la nuova configurazione."))
 
@@ -884,55 +1067,47 @@ class ConnectionNavigator(BaseSSHMenuC):
     def _search_mode(self) -> None:
         """Incremental search mode triggered by '/' key.
 
-        Reads characters one by one with readchar and filters results live.
+        Filters results live. Keys arriving in the same read (a paste, fast
+        typing) are all applied before the results are redrawn once.
         Navigation: UP/DOWN to move, ENTER to connect, ESC to exit.
         """
         query = ""
         selected = 0
+        results = self.config_manager.search_hosts(query)
 
         while True:
-            self.display.clear_screen()
-            results = self.config_manager.search_hosts(query)
-            total = len(results)
+            if not self._pending_keys:
+                self.display.clear_screen()
+                self.display.print_search_results(query, results, selected)
 
-            puts(colored.cyan(f"[/] cerca: {query}_  ({total} risultati)  ESC per uscire"))
-            if not results:
-                puts(colored.yellow("  (nessun risultato)"))
-            else:
-                for i, (breadcrumb, host) in enumerate(results):
-                    friendly = host.get("friendly", host.get("host", ""))
-                    tags = host.get("tags", [])
-                    tag_str = f"  [{' '.join(tags)}]" if tags else ""
-                    line = f"  {breadcrumb} > {friendly}{tag_str}"
-                    if i == selected:
-                        puts(colored.green(f"→ {line}"))
-                    else:
-                        puts(colored.white(f"  {line}"))
-
-            key = readchar.readkey()
+            key = self._next_key()
 
             if key == "\x1b" or key == "q":  # ESC or q exits search
                 return
-            elif key == readchar.key.UP:
+            elif key == KEY_UP:
                 if selected > 0:
                     selected -= 1
-            elif key == readchar.key.DOWN:
-                if selected < total - 1:
+            elif key == KEY_DOWN:
+                if selected < len(results) - 1:
                     selected += 1
-            elif key == readchar.key.ENTER:
+            elif key == KEY_ENTER:
+                self._pending_keys.clear()
                 if results:
                     _, host = results[selected]
                     h = host.get("host", "")
-                    user = host.get("user", get_current_user())
+                    user = get_entry_user(host)
                     port = host.get("port", 22)
                     identity = host.get("certkey")
                     extra_args = host.get("extra_args")
                     launcher = SSHLauncher(h, user, port, identity, extra_args)
-                    launcher.launch()
+                    with cooked():
+                        launcher.launch()
                 return
-            elif key in ("\x7f", "\x08"):  # Backspace
+            elif key in BACKSPACE_KEYS:
                 query = query[:-1]
                 selected = 0
+                results = self.config_manager.search_hosts(query)
             elif key.isprintable() and len(key) == 1:
                 query += key
                 selected = 0
+                results = self.config_manager.search_hosts(query)
@@ -4,8 +4,6 @@ Main entry point for sshmenuc application.
 import os
 import shutil
 
-from .core import ConnectionNavigator
-from .contexts.wizard import add_context_wizard
 from .utils import setup_argument_parser, setup_logging
 
 
@@ -78,6 +76,7 @@ def _migrate_legacy_config(args) -> bool:
         return False
 
     name = input("Nome per il nuovo contesto [default]: ").strip() or "default"
+    from .contexts.wizard import add_context_wizard
     add_context_wizard(name, default_config_path=args.config)
     return True
 
@@ -102,14 +101,19 @@ def main():
 
     # Add-context wizard: create a new named profile interactively, then exit
     if args.add_context is not None:
+        from .contexts.wizard import add_context_wizard
         add_context_wizard(args.add_context, default_config_path=args.config)
         return
 
-    # Multi-context mode: check for contexts.json registry
+    # Interactive menu: the UI stack (readchar, clint, sync) is only loaded
+    # here, so the export and wizard modes above start without it
+    from .core import ConnectionNavigator
     from .contexts import ContextManager
-    ctx_mgr = ContextManager()
 
-    if ctx_mgr.has_contexts():
+    # Multi-context mode: check for contexts.json registry
+    ctx_mgr = ContextManager() if ContextManager.registry_exists() else None
+
+    if ctx_mgr is not None and ctx_mgr.has_contexts():
         # Determine which context to use
         if args.context:
             active_name = args.context
@@ -7,6 +7,7 @@ the main project directory.
 
 import logging
 import os
+import shlex
 import subprocess
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -24,6 +25,7 @@ class PullStatus(Enum):
 class PullResult:
     status: PullStatus
     remote_enc_bytes: Optional[bytes] = field(default=None)
+    prompt_refused: bool = field(default=False)  # OFFLINE because a non-interactive fetch needed a prompt
 
 
 def _is_diverged(stderr: str) -> bool:
@@ -38,7 +40,13 @@ def _is_push_rejected(stderr: str) -> bool:
     return any(p in stderr for p in patterns)
 
 
-def _run_git(args: list, cwd: str, timeout: int = 30) -> subprocess.CompletedProcess:
+def _is_prompt_refused(stderr: str) -> bool:
+    """Return True if git stderr shows a credential or ssh prompt refused in batch mode."""
+    patterns = ("terminal prompts disabled", "Host key verification failed", "Permission denied")
+    return any(p in stderr for p in patterns)
+
+
+def _run_git(args: list, cwd: str, timeout: int = 30, env: Optional[dict] = None) -> subprocess.CompletedProcess:
     """Run a git command in the given directory."""
     cmd = ["git"] + args
     return subprocess.run(
@@ -47,9 +55,40 @@ def _run_git(args: list, cwd: str, timeout: int = 30) -> subprocess.CompletedPro
         capture_output=True,
         text=True,
         timeout=timeout,
+        env=env,
     )
 
 
+def _ssh_command(cwd: str) -> str:
+    """Return the ssh command git uses in cwd, in git's own order of precedence.
+
+    GIT_SSH_COMMAND, then the core.sshCommand setting, then the GIT_SSH
+    program, then plain ssh.
+    """
+    command = os.environ.get("GIT_SSH_COMMAND")
+    if command:
+        return command
+    config = _run_git(["config", "core.sshCommand"], cwd=cwd)
+    if config.returncode == 0 and config.stdout.strip():
+        return config.stdout.strip()
+    program = os.environ.get("GIT_SSH")
+    return shlex.quote(program) if program else "ssh"
+
+
+def _batch_mode_env(cwd: str) -> dict:
+    """Return an environment in which git and ssh fail instead of prompting.
+
+    Used for git commands that run while the terminal is busy with another
+    prompt: credential, host key and key passphrase prompts are refused.
+    The user's ssh command is kept, with BatchMode added.
+
+    Args:
+        cwd: Repository the git commands run in (for core.sshCommand)
+    """
+    ssh = _ssh_command(cwd)
+    return {**os.environ, "GIT_TERMINAL_PROMPT": "0", "GIT_SSH_COMMAND": f"{ssh} -o BatchMode=yes"}
+
+
 def is_remote_reachable(remote_url: str, timeout: int = 10) -> bool:
     """Check if the remote git repository is reachable.
 
@@ -119,11 +158,14 @@ def ensure_repo_initialized(sync_cfg: dict) -> bool:
         return False
 
 
-def pull_remote(sync_cfg: dict) -> PullResult:
+def pull_remote(sync_cfg: dict, interactive: bool = True) -> PullResult:
     """Fetch the latest encrypted config from the remote repo.
 
     Args:
         sync_cfg: Sync configuration dict.
+        interactive: When False, git and ssh may not prompt on the terminal;
+            a fetch that needs a prompt fails and returns OFFLINE with
+            prompt_refused set.
 
     Returns:
         PullResult with status and optional remote encrypted bytes.
@@ -132,13 +174,15 @@ def pull_remote(sync_cfg: dict) -> PullResult:
     branch = sync_cfg.get("branch", "main")
 
     try:
-        result = _run_git(["fetch", "origin", branch], cwd=repo_path)
+        env = None if interactive else _batch_mode_env(repo_path)
+        result = _run_git(["fetch", "origin", branch], cwd=repo_path, env=env)
         if result.returncode != 0:
             logging.warning(f"git fetch failed: {result.stderr.strip()}")
-            return PullResult(status=PullStatus.OFFLINE)
+            refused = not interactive and _is_prompt_refused(result.stderr)
+            return PullResult(status=PullStatus.OFFLINE, prompt_refused=refused)
 
         # Check if remote has the branch
-        check = _run_git(["ls-remote", "--exit-code", "origin", branch], cwd=repo_path)
+        check = _run_git(["ls-remote", "--exit-code", "origin", branch], cwd=repo_path, env=env)
         if check.returncode != 0:
             # Branch doesn't exist on remote yet (empty repo)
             return PullResult(status=PullStatus.NO_CHANGE)
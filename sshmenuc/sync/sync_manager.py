@@ -13,6 +13,8 @@ import json
 import logging
 import os
 import sys
+import threading
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from enum import Enum, auto
 from typing import Optional
@@ -27,6 +29,30 @@ from .git_remote import (
     push_remote,
 )
 from .passphrase_cache import clear as clear_passphrase, get_or_prompt, has_passphrase, set_passphrase
+from ..utils import serialization
+
+
+def _start_background(fn, *args, **kwargs) -> Future:
+    """Run fn(*args, **kwargs) in a daemon thread.
+
+    Unlike a ThreadPoolExecutor worker, a daemon thread is not joined at
+    exit: if the caller stops waiting (Ctrl+C, EOF at a prompt), the
+    process quits at once instead of waiting for fn to finish.
+
+    Returns:
+        Future resolved with fn's result or exception
+    """
+    future: Future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
 class SyncState(Enum):
@@ -88,8 +114,19 @@ class SyncManager:
         if not ensure_repo_initialized(self._sync_cfg):
             return self._handle_offline()
 
-        passphrase = get_or_prompt("Enter sync passphrase: ")
-        pull_result = pull_remote(self._sync_cfg)
+        if has_passphrase():
+            passphrase = get_or_prompt("Enter sync passphrase: ")
+            pull_result = pull_remote(self._sync_cfg)
+        else:
+            # The fetch does not need the passphrase: run it while the user types.
+            # It shares the terminal with the prompt, so git and ssh may not prompt.
+            pending_pull = _start_background(pull_remote, self._sync_cfg, interactive=False)
+            passphrase = get_or_prompt("Enter sync passphrase: ")
+            pull_result = pending_pull.result()
+            if pull_result.prompt_refused:
+                # The fetch needed a prompt (credentials, host key, key
+                # passphrase): retry now that the terminal is free
+                pull_result = pull_remote(self._sync_cfg)
 
         if pull_result.status == PullStatus.OFFLINE:
             return self._handle_offline()
@@ -301,8 +338,7 @@ class SyncManager:
         os.makedirs(sync_dir, exist_ok=True)
 
         try:
-            with open(self._sync_config_path, "w") as f:
-                json.dump(sync_cfg, f, indent=4)
+            serialization.dump_file(sync_cfg, self._sync_config_path)
         except OSError as e:
             print(f"Errore scrittura sync.json: {e}")
             return False
@@ -376,8 +412,7 @@ class SyncManager:
                     logging.warning(f"[SYNC] Cannot persist sync metadata: {e}")
             return
         try:
-            with open(self._sync_config_path, "w") as f:
-                json.dump(self._sync_cfg, f, indent=4)
+            serialization.dump_file(self._sync_cfg, self._sync_config_path)
         except OSError as e:
             logging.warning(f"[SYNC] Cannot save sync metadata: {e}")
 
@@ -1,11 +1,16 @@
 """
 User interface rendering management.
 """
-import os
-import subprocess
-import logging
-from typing import List, Dict, Any, Union
+import shutil
+import sys
+from typing import List, Dict, Any, Iterable, Tuple, Union
 from .colors import Colors
+from ..utils.helpers import key_at
+
+
+CLEAR_SCREEN_SEQ = "\033[H\033[2J"  # Cursor home + erase display (what `clear` emits)
+TABLE_WIDTH = 68  # Visible width of a table row, in columns
+TABLE_BORDER = "+--------+------------------------------------+-------------------+"
 
 
 class MenuDisplay:
@@ -13,11 +18,55 @@ class MenuDisplay:
 
     def __init__(self):
         self.colors = Colors()
+        # Static table chrome, colored once instead of on every redraw
+        self._border_line = f"{self.colors.OKCYAN}{TABLE_BORDER}{self.colors.ENDC}"
+        self._header_cache: Dict[tuple, List[str]] = {}
+        self._instructions_cache: Dict[Tuple[str, str], str] = {}
+        # Row templates with colors and column widths baked in:
+        # {0} index, {1} marker, {2} title, {3} tags. The title is cut to its
+        # column so that every row is exactly one TABLE_WIDTH terminal line,
+        # which repaint_rows() relies on.
+        c, g, e = self.colors.OKCYAN, self.colors.OKGREEN, self.colors.ENDC
+        self._row_fmt_selected = (
+            f"{c}|{e}{g}{{0}} {e}{c}|{e}{g} {{1}} {{2:<31.31}}{e}{c}|{e}{c}{{3:<19}} {e}{c}|{e}"
+        )
+        self._row_fmt = (
+            f"{c}|{e}{{0}} {c}|{e} {{1}} {{2:<31.31}}{c}|{e}{c}{{3:<19}} {e}{c}|{e}"
+        )
 
     def clear_screen(self) -> None:
-        """Clear the terminal screen."""
-        cmd = "cls" if os.name == "nt" else "clear"
-        subprocess.run([cmd], shell=True, check=False)
+        """Clear the terminal screen.
+
+        The escape sequence is written directly instead of spawning a
+        `clear`/`cls` process on every redraw. The menu colors already rely
+        on ANSI support, so this works on every terminal that renders the menu.
+        """
+        sys.stdout.write(CLEAR_SCREEN_SEQ)
+        sys.stdout.flush()
+
+    def format_instructions(self, sync_label: str = "", context_label: str = "") -> str:
+        """Build the usage instructions line.
+
+        The line only depends on the two labels, so it is built once per pair.
+
+        Args:
+            sync_label: Optional sync status label shown at the end of the line.
+            context_label: Optional active context name (shown when multi-context is active).
+
+        Returns:
+            The instructions line, without trailing newline
+        """
+        key = (sync_label, context_label)
+        line = self._instructions_cache.get(key)
+        if line is None:
+            line = "Navigate: ↑↓  Select: SPACE  Connect: ENTER  |  Edit: [a]dd [e]dit [d]elete [r]ename  |  [s]ync"
+            if context_label:
+                line += f"  [x]ctx:{context_label}  [c]manage"
+            line += "  |  Quit: q"
+            if sync_label:
+                line += f"  [{sync_label}]"
+            self._instructions_cache[key] = line
+        return line
 
     def print_instructions(self, sync_label: str = "", context_label: str = "") -> None:
         """Print usage instructions.
@@ -26,13 +75,31 @@ class MenuDisplay:
             sync_label: Optional sync status label shown at the end of the line.
             context_label: Optional active context name (shown when multi-context is active).
         """
-        line = "Navigate: ↑↓  Select: SPACE  Connect: ENTER  |  Edit: [a]dd [e]dit [d]elete [r]ename  |  [s]ync"
-        if context_label:
-            line += f"  [x]ctx:{context_label}  [c]manage"
-        line += "  |  Quit: q"
-        if sync_label:
-            line += f"  [{sync_label}]"
-        print(line)
+        print(self.format_instructions(sync_label, context_label))
+
+    def format_header(self, headers: List[str]) -> List[str]:
+        """Build the table header lines.
+
+        Args:
+            headers: List of header column names
+
+        Returns:
+            Top border, column titles and bottom border lines (a new list,
+            the lines themselves are built once per headers value)
+        """
+        key = tuple(headers)
+        lines = self._header_cache.get(key)
+        if lines is None:
+            lines = [
+                self._border_line,
+                f"{self.colors.OKCYAN}|{self.colors.ENDC}{self.colors.HEADER}{'#':>7} {self.colors.ENDC}"
+                f"{self.colors.OKCYAN}|{self.colors.ENDC}{self.colors.HEADER}{headers[0]:^35} {self.colors.ENDC}"
+                f"{self.colors.OKCYAN}|{self.colors.ENDC}{self.colors.HEADER}{'TAGS':^19} {self.colors.ENDC}"
+                f"{self.colors.OKCYAN}|{self.colors.ENDC}",
+                self._border_line,
+            ]
+            self._header_cache[key] = lines
+        return list(lines)
 
     def print_header(self, headers: List[str]) -> None:
         """Print table header.
@@ -40,24 +107,20 @@ class MenuDisplay:
         Args:
             headers: List of header column names
         """
-        tbl = "+--------+------------------------------------+-------------------+"
-        print(f"{self.colors.OKCYAN}{tbl}{self.colors.ENDC}")
-        print(
-            f"{self.colors.OKCYAN}|{self.colors.ENDC}{self.colors.HEADER}{'#':>7} {self.colors.ENDC}"
-            f"{self.colors.OKCYAN}|{self.colors.ENDC}{self.colors.HEADER}{headers[0]:^35} {self.colors.ENDC}"
-            f"{self.colors.OKCYAN}|{self.colors.ENDC}{self.colors.HEADER}{'TAGS':^19} {self.colors.ENDC}"
-            f"{self.colors.OKCYAN}|{self.colors.ENDC}"
-        )
-        print(f"{self.colors.OKCYAN}{tbl}{self.colors.ENDC}")
+        for line in self.format_header(headers):
+            print(line)
     
-    def print_row(self, infos: tuple, is_selected: bool, is_host: bool, is_marked: bool = False) -> None:
-        """Print a table row.
+    def format_row(self, infos: tuple, is_selected: bool, is_host: bool, is_marked: bool = False) -> str:
+        """Build a table row.
 
         Args:
             infos: Tuple of (index, data) for the row
             is_selected: Whether this row is currently selected
             is_host: Whether this row represents a host entry
             is_marked: Whether this row is marked for multi-selection
+
+        Returns:
+            The colored row string (without trailing newline)
         """
         idx_display = ""
         title = ""
@@ -79,22 +142,19 @@ class MenuDisplay:
 
         marker = "[x]" if is_marked and is_host else ("[ ]" if is_host else "   ")
 
-        if is_selected:
-            row = (
-                f"{self.colors.OKCYAN}|{self.colors.ENDC}{self.colors.OKGREEN}{idx_display} {self.colors.ENDC}"
-                f"{self.colors.OKCYAN}|{self.colors.ENDC}{self.colors.OKGREEN} {marker} {title:<31}{self.colors.ENDC}"
-                f"{self.colors.OKCYAN}|{self.colors.ENDC}{self.colors.OKCYAN}{tags_str:<19} {self.colors.ENDC}"
-                f"{self.colors.OKCYAN}|{self.colors.ENDC}"
-            )
-        else:
-            row = (
-                f"{self.colors.OKCYAN}|{self.colors.ENDC}{idx_display} {self.colors.OKCYAN}|{self.colors.ENDC}"
-                f" {marker} {title:<31}{self.colors.OKCYAN}|{self.colors.ENDC}"
-                f"{self.colors.OKCYAN}{tags_str:<19} {self.colors.ENDC}"
-                f"{self.colors.OKCYAN}|{self.colors.ENDC}"
-            )
-
-        print(row)
+        row_fmt = self._row_fmt_selected if is_selected else self._row_fmt
+        return row_fmt.format(idx_display, marker, title, tags_str)
+
+    def print_row(self, infos: tuple, is_selected: bool, is_host: bool, is_marked: bool = False) -> None:
+        """Print a table row.
+
+        Args:
+            infos: Tuple of (index, data) for the row
+            is_selected: Whether this row is currently selected
+            is_host: Whether this row represents a host entry
+            is_marked: Whether this row is marked for multi-selection
+        """
+        print(self.format_row(infos, is_selected, is_host, is_marked))
     
     def print_breadcrumb(self, breadcrumb: str) -> None:
         """Print current navigation path above the table.
@@ -104,35 +164,112 @@ class MenuDisplay:
         """
         print(f"{self.colors.OKCYAN}  {breadcrumb}{self.colors.ENDC}")
 
+    def format_footer(self) -> str:
+        """Build the table footer line."""
+        return self._border_line
+
     def print_footer(self) -> None:
         """Print table footer."""
-        print(f"{self.colors.OKCYAN}+--------+------------------------------------+-------------------+{self.colors.ENDC}")
+        print(self.format_footer())
+
+    def _format_item_row(self, index: int, item: Any, is_selected: bool, is_marked: bool) -> str:
+        """Build the row for one item of a menu node.
+
+        Args:
+            index: Position of the item in the node
+            item: Group key (dict nodes) or list element (host entry or subgroup)
+            is_selected: Whether this row is currently selected
+            is_marked: Whether this row is marked for multi-selection
+
+        Returns:
+            The colored row string
+        """
+        if isinstance(item, dict) and ("friendly" in item or "host" in item):
+            return self.format_row([index, item], is_selected, is_host=True, is_marked=is_marked)
+        if isinstance(item, dict):
+            item = next(iter(item)) if item else str(item)
+        return self.format_row([index, item], is_selected, is_host=False, is_marked=is_marked)
 
     def print_table(self, data: Union[Dict[str, Any], List[Any]], selected_target: int,
                    marked_indices: set, level: int) -> None:
         """Print complete table with data.
 
+        The whole table is assembled in memory and emitted with a single
+        write, instead of one terminal write per line.
+
         Args:
             data: Dictionary or list of items to display
             selected_target: Index of currently selected item
             marked_indices: Set of indices marked for multi-selection
             level: Current navigation depth level
         """
-        self.print_header(["Description"])
-        
-        if isinstance(data, dict):
-            keys = list(data.keys())
-            for idx, key in enumerate(keys):
-                marked = idx in marked_indices
-                is_selected = idx == selected_target
-                self.print_row([idx, key], is_selected, is_host=False, is_marked=marked)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                marked = i in marked_indices
-                if isinstance(item, dict) and ("friendly" in item or "host" in item):
-                    self.print_row([i, item], i == selected_target, is_host=True, is_marked=marked)
-                else:
-                    key = list(item.keys())[0] if isinstance(item, dict) and item else str(item)
-                    self.print_row([i, key], i == selected_target, is_host=False, is_marked=marked)
+        frame = self.format_header(["Description"])
+        items = data if isinstance(data, (dict, list)) else []  # Iterating a dict yields its keys
+        for i, item in enumerate(items):
+            frame.append(self._format_item_row(i, item, i == selected_target, i in marked_indices))
         
-        self.print_footer()
\ No newline at end of file
+        frame.append(self.format_footer())
+        sys.stdout.write("\n".join(frame) + "\n")
+        sys.stdout.flush()
+
+    def print_search_results(self, query: str, results: List[Tuple[str, Dict[str, Any]]],
+                             selected: int) -> None:
+        """Print the incremental search screen with a single write.
+
+        Args:
+            query: Current search query
+            results: List of (breadcrumb, host_entry) tuples
+            selected: Index of the highlighted result
+        """
+        c = self.colors
+        lines = [f"{c.OKCYAN}[/] cerca: {query}_  ({len(results)} risultati)  ESC per uscire{c.ENDC}"]
+        if not results:
+            lines.append(f"{c.WARNING}  (nessun risultato){c.ENDC}")
+        for i, (breadcrumb, host) in enumerate(results):
+            friendly = host.get("friendly", host.get("host", ""))
+            tags = host.get("tags", [])
+            tag_str = f"  [{' '.join(tags)}]" if tags else ""
+            line = f"  {breadcrumb} > {friendly}{tag_str}"
+            if i == selected:
+                lines.append(f"{c.OKGREEN}→ {line}{c.ENDC}")
+            else:
+                lines.append(f"  {line}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+    def repaint_rows(self, data: Union[Dict[str, Any], List[Any]], rows: Iterable[int],
+                     selected: int, marked_indices: set) -> bool:
+        """Redraw the given rows of the table printed by the last print_table().
+
+        Must be called right after print_table() rendered the same data, with
+        the cursor still on the line below the footer. Rows are reached with
+        relative cursor movements, so wrapped lines above the table don't
+        matter. Each row is rendered with its current selection and mark state.
+
+        Args:
+            data: Dictionary or list of items shown by the last print_table()
+            rows: Indices of the rows to rewrite; out-of-range ones are skipped
+            selected: Index of the currently selected item
+            marked_indices: Set of indices marked for multi-selection
+
+        Returns:
+            True if the rows were repainted, False if a full redraw is needed
+            (terminal too small to hold the rows on screen).
+        """
+        count = len(data) if isinstance(data, (dict, list)) else 0
+        size = shutil.get_terminal_size()
+        if size.columns < TABLE_WIDTH:
+            return False
+        out = []
+        for i in sorted(rows):
+            if not 0 <= i < count:
+                continue
+            lines_up = count - i + 1  # +1 for the footer
+            if lines_up >= size.lines:
+                return False
+            item = key_at(data, i) if isinstance(data, dict) else data[i]
+            row = self._format_item_row(i, item, i == selected, i in marked_indices)
+            out.append(f"\033[{lines_up}A\r\033[2K{row}\r\033[{lines_up}B")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        return True
@@ -0,0 +1,197 @@
+"""
+Keyboard input reading.
+"""
+import os
+import select
+import sys
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+import readchar
+
+try:
+    import termios
+except ImportError:  # Windows: no termios, readchar handles the console
+    termios = None
+
+
+READ_CHUNK = 1024  # Max bytes read per burst (key repeat, paste)
+
+# Terminal settings to restore when the active cbreak() block exits; None
+# while the terminal is in its normal mode (outside cbreak() or in cooked())
+_cbreak_restore: Optional[list] = None
+
+# Enter arrives as CR (cbreak() clears ICRNL) or LF (piped input); readchar
+# 0.7 names CR as key.ENTER and 4.x names LF, so both map to key.ENTER
+_ENTER_CHARS = frozenset(("\r", "\n"))
+
+# Escape sequence continuation bytes, in the same order readchar.readkey() checks them
+_ESC_CONTINUATIONS = ("\x4f\x5b", "\x31\x32\x33\x35\x36", "\x30\x31\x33\x34\x35\x37\x38\x39")
+
+
+def _key_length(text: str, start: int) -> int:
+    """Return the length of the key starting at text[start].
+
+    Escape sequences are split exactly like readchar.readkey() reads them,
+    so decoded keys compare equal to the readchar.key constants.
+    """
+    if text[start] != "\x1b":
+        return 1
+    length = 2
+    for continuation in _ESC_CONTINUATIONS:
+        last = start + length - 1
+        if last >= len(text) or text[last] not in continuation:
+            break
+        length += 1
+    return min(length, len(text) - start)
+
+
+def decode_keys(text: str) -> List[str]:
+    """Split raw terminal input into individual keys.
+
+    Args:
+        text: Characters read from the terminal
+
+    Returns:
+        List of keys, escape sequences kept whole (e.g. readchar.key.UP),
+        CR and LF both returned as readchar.key.ENTER
+
+    Raises:
+        KeyboardInterrupt: If the input contains Ctrl+C
+    """
+    if "\x1b" not in text:
+        # No escape sequence: every character is a key of its own
+        if readchar.key.CTRL_C in text:
+            raise KeyboardInterrupt
+        enter = readchar.key.ENTER
+        return [enter if ch in _ENTER_CHARS else ch for ch in text]
+    keys = []
+    i = 0
+    while i < len(text):
+        length = _key_length(text, i)
+        key = text[i:i + length]
+        if key == readchar.key.CTRL_C:
+            raise KeyboardInterrupt
+        keys.append(readchar.key.ENTER if key in _ENTER_CHARS else key)
+        i += length
+    return keys
+
+
+def _tty_fd() -> Optional[int]:
+    """Return the file descriptor of stdin if it is a POSIX terminal, else None."""
+    if termios is None:
+        return None
+    try:
+        fd = sys.stdin.fileno()
+        return fd if os.isatty(fd) else None
+    except (OSError, ValueError):
+        return None
+
+
+@contextmanager
+def cbreak() -> Iterator[None]:
+    """Keep the terminal in cbreak mode for the duration of the block.
+
+    Keys are delivered as soon as they are typed and are not echoed, so
+    keys pressed while the menu is being drawn neither print garbage nor
+    get lost. read_keys() reads in this mode. Nested blocks, and stdin
+    that is not a terminal, leave the mode alone.
+
+    Yields:
+        None
+    """
+    global _cbreak_restore
+    fd = _tty_fd()
+    if fd is None or _cbreak_restore is not None:
+        yield
+        return
+    old_settings = termios.tcgetattr(fd)
+    term = list(old_settings)
+    term[6] = list(old_settings[6])  # Control characters, modified below
+    term[0] &= ~termios.ICRNL  # Enter reads as CR whatever the tty's default
+    term[3] &= ~(termios.ICANON | termios.ECHO | termios.IGNBRK | termios.BRKINT)
+    term[6][termios.VMIN] = 1
+    term[6][termios.VTIME] = 0
+    termios.tcsetattr(fd, termios.TCSANOW, term)
+    _cbreak_restore = old_settings
+    try:
+        yield
+    finally:
+        _cbreak_restore = None
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+@contextmanager
+def cooked() -> Iterator[None]:
+    """Return to the normal terminal mode inside a cbreak() block.
+
+    For input() prompts and child processes (ssh, tmux), which need line
+    editing and echo. cbreak mode is set again when the block exits.
+    Outside cbreak() this does nothing.
+
+    Yields:
+        None
+    """
+    global _cbreak_restore
+    fd = _tty_fd()
+    saved = _cbreak_restore
+    if fd is None or saved is None:
+        yield
+        return
+    term = termios.tcgetattr(fd)
+    termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    _cbreak_restore = None
+    try:
+        yield
+    finally:
+        _cbreak_restore = saved
+        termios.tcsetattr(fd, termios.TCSANOW, term)
+
+
+def read_keys(wait: bool = True) -> List[str]:
+    """Read every keystroke currently available on the terminal.
+
+    Blocks until at least one key is pressed, then returns it together with
+    any keys already queued behind it, using a single os.read(). Only reads:
+    the terminal must already be in cbreak mode (see cbreak()). Outside a
+    cbreak() block, or when stdin is not a POSIX tty, falls back to one
+    readchar.readkey().
+
+    Args:
+        wait: Block for a key. When False, only keys already typed are
+            returned, possibly none (always none without cbreak mode)
+
+    Returns:
+        List of keys ("" on end of input, like readchar); non-empty when wait is True
+    """
+    fd = _tty_fd()
+    if fd is None or _cbreak_restore is None:
+        if not wait:
+            return []
+        key = readchar.readkey()
+        return [readchar.key.ENTER if key in _ENTER_CHARS else key]
+
+    if not wait and not select.select([fd], [], [], 0)[0]:
+        return []
+    data = os.read(fd, READ_CHUNK)
+    return decode_keys(data.decode(errors="replace")) or [""]
+
+
+def one_char_prompt(message: str) -> str:
+    """Show a prompt and answer it with a single keystroke.
+
+    Everything already queued on the terminal is read together with the
+    first key and dropped, so a pasted line cannot spill into the next
+    prompt or the session started next.
+
+    Args:
+        message: Prompt text, printed without a newline
+
+    Returns:
+        The first key pressed
+    """
+    print(message, end="", flush=True)
+    with cbreak():
+        key = read_keys()[0]
+    print()
+    return key
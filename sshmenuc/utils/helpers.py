@@ -1,19 +1,28 @@
 """
 Common utility functions.
 """
-import argparse
 import getpass
 import os
 import sys
 import logging
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
+if TYPE_CHECKING:
+    import argparse
 
-def setup_argument_parser() -> argparse.ArgumentParser:
+
+def setup_argument_parser() -> "argparse.ArgumentParser":
     """Configure command-line argument parser.
 
+    argparse is imported here, since only the CLI entry point needs it.
+
     Returns:
         Configured ArgumentParser instance
     """
+    import argparse
+
     parser = argparse.ArgumentParser(description="SSH Connection Manager")
     parser.add_argument(
         "-c",
@@ -80,6 +89,7 @@ def get_default_config_path() -> str:
     return os.path.expanduser("~/.config/sshmenuc/config.json")
 
 
+@lru_cache(maxsize=1)
 def get_current_user() -> str:
     """Get current username with fallback for Docker/containerized environments.
 
@@ -89,6 +99,8 @@ def get_current_user() -> str:
     3. getpass.getuser() - additional fallback
     4. 'user' - final fallback if all else fails
 
+    The lookup runs once per process; later calls return the cached name.
+
     Returns:
         Current username string
     """
@@ -114,6 +126,38 @@ def get_current_user() -> str:
     return 'user'
 
 
+def get_entry_user(entry: dict) -> str:
+    """Return the SSH user of a host entry, falling back to the current user.
+
+    The fallback is resolved only when the entry has no 'user' key, unlike an
+    eagerly evaluated ``entry.get("user", get_current_user())``.
+
+    Args:
+        entry: Host entry dictionary
+
+    Returns:
+        Username to connect with
+    """
+    if "user" in entry:
+        return entry["user"]
+    return get_current_user()
+
+
+def key_at(mapping: Mapping[str, Any], index: int) -> Optional[str]:
+    """Return the key at a position of a mapping, without copying its keys.
+
+    Args:
+        mapping: Dictionary to index (insertion order)
+        index: Position of the wanted key
+
+    Returns:
+        The key, or None if index is out of range
+    """
+    if not 0 <= index < len(mapping):
+        return None
+    return next(islice(mapping, index, None))
+
+
 def get_sync_config_path() -> str:
     """Return the default path for the sync configuration file.
 
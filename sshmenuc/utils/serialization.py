@@ -0,0 +1,141 @@
+"""
+JSON serialization for config files.
+
+Reading uses orjson when it is installed (optional extra: sshmenuc[orjson]),
+which parses several times faster than the stdlib json module. Writing
+always uses the stdlib, so the files on disk have the same layout
+(json.dump(..., indent=4)) whether orjson is installed or not.
+"""
+import json
+import mmap
+import os
+import pickle
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+MMAP_THRESHOLD = 64 * 1024  # Smaller files are cheaper to read() than to map
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: Raw file content (bytes or str)
+
+    Returns:
+        The decoded object
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error
+            class is a subclass of it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, pretty: bool = True) -> bytes:
+    """Serialize an object to JSON.
+
+    Always the stdlib encoder: orjson only supports a 2-space indent, and the
+    file layout must not depend on which packages are installed.
+
+    Args:
+        obj: Object to serialize
+        pretty: Indent by 4 for human editing; False writes compact JSON for
+            machine-managed files
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if pretty:
+        return json.dumps(obj, indent=4).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def snapshot(obj: Any) -> bytes:
+    """Freeze a decoded document for a cache shared across instances.
+
+    Each restore() returns an independent copy, so an instance editing its
+    data in place never changes what other instances load. pickle is used
+    because restoring is several times faster than re-parsing the JSON or
+    copy.deepcopy().
+
+    Args:
+        obj: Decoded JSON document
+
+    Returns:
+        Opaque snapshot bytes
+    """
+    return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+
+def restore(snap: bytes) -> Any:
+    """Return a fresh copy of a document frozen by snapshot().
+
+    Args:
+        snap: Bytes returned by snapshot()
+
+    Returns:
+        The decoded document
+    """
+    return pickle.loads(snap)
+
+
+def load_file(path: str) -> Any:
+    """Read and parse a JSON file.
+
+    With orjson, files of MMAP_THRESHOLD bytes or more are memory-mapped and
+    parsed straight from the mapping, without a full-size bytes copy.
+
+    Args:
+        path: File path
+
+    Returns:
+        The decoded object
+    """
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return loads(f.read())
+
+
+def dump_file(obj: Any, path: str, pretty: bool = True) -> None:
+    """Serialize an object and atomically replace a JSON file with it.
+
+    The document is written to a temporary file next to the target and
+    renamed over it, so a crash mid-write never leaves a truncated file.
+    Symlinks are followed and the existing file mode is kept.
+
+    Args:
+        obj: Object to serialize
+        path: File path
+        pretty: Indent for human editing (see dumps())
+    """
+    data = dumps(obj, pretty)
+    target = os.path.realpath(path)
+    tmp = target + ".tmp"
+    try:
+        mode = os.stat(target).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None  # New file: keep the default (umask) mode
+    try:
+        # Created with the target's mode, so the data is never readable wider
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     0o666 if mode is None else mode)
+        with os.fdopen(fd, "wb") as f:
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)  # Undo umask, or reset a stale tmp
+            f.write(data)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
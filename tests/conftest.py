@@ -5,7 +5,31 @@ import pytest
 import tempfile
 import json
 import os
+import shutil
 from pathlib import Path
+from unittest.mock import patch
+
+
+@pytest.fixture(autouse=True)
+def tmux_probe():
+    """Answer the cached tmux probe from shutil.which, as tmux 3.3.
+
+    Each test's shutil.which mock stays effective, and "tmux -V" never shows
+    up in subprocess.run call assertions. Set side_effect to simulate other
+    tmux versions.
+    """
+    with patch("sshmenuc.core.launcher._tmux_info",
+               side_effect=lambda: (shutil.which("tmux"), (3, 3))) as probe:
+        yield probe
+
+
+@pytest.fixture(autouse=True)
+def current_user_cache():
+    """Forget the cached current user, so each test sees its own os.getlogin() mock."""
+    from sshmenuc.utils.helpers import get_current_user
+    get_current_user.cache_clear()
+    yield
+    get_current_user.cache_clear()
 
 
 @pytest.fixture
@@ -3,6 +3,7 @@
 import json
 import os
 import pytest
+from unittest.mock import patch
 
 from sshmenuc.contexts.context_manager import ContextManager
 
@@ -73,6 +74,18 @@ class TestHasContexts:
         assert m.has_contexts() is False
 
 
+class TestRegistryExists:
+    def test_true_when_file_present(self, contexts_file):
+        assert ContextManager.registry_exists(contexts_file) is True
+
+    def test_false_when_file_absent(self, tmp_path):
+        assert ContextManager.registry_exists(str(tmp_path / "contexts.json")) is False
+
+    def test_defaults_to_global_registry_path(self, contexts_file):
+        with patch("sshmenuc.contexts.context_manager.CONTEXTS_CONFIG_PATH", contexts_file):
+            assert ContextManager.registry_exists() is True
+
+
 class TestListContexts:
     def test_returns_sorted_names(self, ctx):
         assert ctx.list_contexts() == ["home", "isp", "poste"]
@@ -113,6 +126,12 @@ class TestGetConfigFile:
     def test_paths_differ_per_context(self, ctx):
         assert ctx.get_config_file("home") != ctx.get_config_file("isp")
 
+    def test_follows_patched_base_dir(self, ctx, tmp_path):
+        ctx.get_config_file("isp")
+        with patch("sshmenuc.contexts.context_manager.CONTEXTS_BASE_DIR", str(tmp_path)):
+            assert ctx.get_config_file("isp") == str(tmp_path / "isp" / "config.json")
+            assert ctx.get_enc_file("isp") == str(tmp_path / "isp" / "config.json.enc")
+
 
 class TestGetSyncCfg:
     def test_returns_dict_for_known_context(self, ctx):
@@ -132,6 +151,17 @@ class TestGetSyncCfg:
         cfg["remote_url"] = "tampered"
         assert ctx.get_sync_cfg("home")["remote_url"] != "tampered"
 
+    def test_readonly_returns_view(self, ctx):
+        cfg = ctx.get_sync_cfg("home", readonly=True)
+        assert cfg["remote_file"] == "home.enc"
+        with pytest.raises(TypeError):
+            cfg["remote_url"] = "tampered"
+        ctx.update_sync_config("home", {"branch": "dev"})
+        assert cfg["branch"] == "dev"
+
+    def test_readonly_unknown_context_is_empty(self, ctx):
+        assert dict(ctx.get_sync_cfg("unknown", readonly=True)) == {}
+
 
 class TestSetActive:
     def test_persists_active_to_file(self, ctx, contexts_file):
@@ -179,6 +209,35 @@ class TestAddRemoveContext:
         ctx.remove_context("nonexistent")  # Should not raise
 
 
+class TestBatch:
+    def test_add_contexts_writes_once(self, ctx, contexts_file):
+        with patch("sshmenuc.utils.serialization.dump_file") as mock_dump:
+            ctx.add_contexts({"a": {"remote_file": "a.enc"}, "b": {"remote_file": "b.enc"}})
+        assert mock_dump.call_count == 1
+        assert {"a", "b"} <= set(mock_dump.call_args[0][0]["contexts"])
+
+    def test_add_contexts_persists(self, ctx, contexts_file):
+        ctx.add_contexts({"a": {}, "b": {}})
+        with open(contexts_file) as f:
+            assert {"a", "b"} <= set(json.load(f)["contexts"])
+
+    def test_batch_defers_until_outermost_exit(self, ctx, contexts_file):
+        with patch("sshmenuc.utils.serialization.dump_file") as mock_dump:
+            with ctx.batch():
+                ctx.set_active("isp")
+                with ctx.batch():
+                    ctx.remove_context("poste")
+                assert mock_dump.call_count == 0
+                assert ctx.get_active() == "isp"
+            assert mock_dump.call_count == 1
+
+    def test_batch_without_changes_does_not_write(self, ctx):
+        with patch("sshmenuc.utils.serialization.dump_file") as mock_dump:
+            with ctx.batch():
+                ctx.list_contexts()
+        mock_dump.assert_not_called()
+
+
 class TestDiscoverAvailable:
     # ctx fixture has home.enc, isp.enc, config.enc already registered
 
@@ -221,3 +280,52 @@ class TestEnsureContextDir:
             assert os.path.isdir(str(tmp_path / "contexts" / "test_ctx"))
         finally:
             cm_module.CONTEXTS_BASE_DIR = original
+
+
+class TestCrossInstanceCache:
+    def test_second_instance_reuses_parse(self, ctx, contexts_file):
+        ctx.list_contexts()
+        other = ContextManager(contexts_config_path=contexts_file)
+        with patch("sshmenuc.utils.serialization.load_file") as mock_load:
+            assert other.list_contexts() == ["home", "isp", "poste"]
+        mock_load.assert_not_called()
+
+    def test_external_change_is_reloaded(self, ctx, contexts_file):
+        ctx.list_contexts()
+        changed = dict(SAMPLE_CONTEXTS, contexts={"work": {}})
+        with open(contexts_file, "w") as f:
+            json.dump(changed, f)
+        st = os.stat(contexts_file)
+        os.utime(contexts_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert ContextManager(contexts_config_path=contexts_file).list_contexts() == ["work"]
+
+    def test_save_refreshes_shared_entry(self, ctx, contexts_file):
+        ctx.add_context("lab", {"remote_file": "lab.enc"})
+        other = ContextManager(contexts_config_path=contexts_file)
+        assert "lab" in other.list_contexts()
+
+    def test_instances_do_not_share_data(self, ctx, contexts_file):
+        ctx.list_contexts()
+        other = ContextManager(contexts_config_path=contexts_file)
+        other.list_contexts()
+        assert other._data == ctx._data
+        assert other._data is not ctx._data
+
+    def test_failed_write_not_seen_by_other_instances(self, ctx, contexts_file):
+        ctx.list_contexts()
+        with patch("sshmenuc.utils.serialization.dump_file", side_effect=OSError("disk full")):
+            ctx.add_context("lab", {})
+        assert "lab" not in ContextManager(contexts_config_path=contexts_file).list_contexts()
+
+    def test_sorted_names_reused_until_change(self, ctx):
+        with patch("sshmenuc.contexts.context_manager.sorted", create=True, side_effect=sorted) as mock_sorted:
+            assert ctx.list_contexts() == ["home", "isp", "poste"]
+            assert ctx.get_active() == "home"
+            ctx.list_contexts()
+            assert mock_sorted.call_count == 1
+            ctx.add_context("alpha", {})
+            assert ctx.list_contexts()[0] == "alpha"
+            assert mock_sorted.call_count == 2
+
+    def test_instances_have_no_attribute_dict(self, ctx):
+        assert not hasattr(ctx, "__dict__")
@@ -4,6 +4,8 @@ Tests for the base class BaseSSHMenuC.
 import pytest
 import tempfile
 import json
+import os
+from unittest.mock import patch
 from sshmenuc.core.base import BaseSSHMenuC
 
 
@@ -71,6 +73,31 @@ class TestBaseSSHMenuC:
         base.config_data = {"targets": []}
         assert base.has_global_hosts() is False
     
+    def test_validate_host_entries_warns_on_bad_extra_args(self, caplog):
+        """Test unparseable extra_args are reported, valid ones are not."""
+        base = ConcreteBaseSSHMenuC()
+        base.config_data = {"targets": [{"G": [
+            {"friendly": "ok", "host": "a", "extra_args": "-o ServerAliveInterval=30 -A"},
+            {"friendly": "quoted", "host": "b", "extra_args": "-o 'ProxyCommand ssh -W %h:%p jump'"},
+            {"friendly": "bad", "host": "c", "extra_args": "-o 'unclosed"},
+        ]}]}
+        with caplog.at_level("WARNING"):
+            base._validate_host_entries()
+        messages = [r.getMessage() for r in caplog.records]
+        assert len(messages) == 1
+        assert "[bad] Invalid extra_args" in messages[0]
+
+    @patch("shlex.split")
+    def test_validate_host_entries_skips_lexer_for_plain_args(self, mock_split):
+        """Test extra_args without quotes or backslashes are not run through shlex."""
+        base = ConcreteBaseSSHMenuC()
+        base.config_data = {"targets": [{"G": [
+            {"friendly": "plain", "host": "a", "extra_args": "-A -o ServerAliveInterval=30"},
+            {"friendly": "quoted", "host": "b", "extra_args": "-o \"User x\""},
+        ]}]}
+        base._validate_host_entries()
+        mock_split.assert_called_once_with("-o \"User x\"")
+
     def test_validate_config_implementation(self):
         """Test that validate_config is properly implemented."""
         base = ConcreteBaseSSHMenuC()
@@ -103,6 +130,30 @@ class TestBaseSSHMenuC:
         result = ConcreteBaseSSHMenuC._normalize_config({})
         assert result == {"targets": []}
 
+    def test_normalize_config_keyed_targets(self):
+        """Test _normalize_config converts a name-keyed targets dict, in order."""
+        keyed = {
+            "targets": {
+                "Casa": [{"friendly": "router", "host": "192.168.1.1"}],
+                "DXC": [{"friendly": "server", "host": "10.0.0.1"}],
+            }
+        }
+        result = ConcreteBaseSSHMenuC._normalize_config(keyed)
+        assert result == {
+            "targets": [
+                {"Casa": [{"friendly": "router", "host": "192.168.1.1"}]},
+                {"DXC": [{"friendly": "server", "host": "10.0.0.1"}]},
+            ]
+        }
+
+    def test_load_config_keyed_targets_file(self, tmp_path):
+        """Test load_config reads a config file with name-keyed targets."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"targets": {"Casa": [{"friendly": "router", "host": "h"}]}}))
+        base = ConcreteBaseSSHMenuC(str(path))
+        base.load_config()
+        assert base.config_data == {"targets": [{"Casa": [{"friendly": "router", "host": "h"}]}]}
+
     def test_load_config_encrypted_path_old_format(self):
         """Test load_config normalizes old-format data returned by _encrypted_load hook."""
         base = ConcreteBaseSSHMenuC()
@@ -121,4 +172,69 @@ class TestBaseSSHMenuC:
         new_fmt = {"targets": [{"Casa": [{"friendly": "router", "host": "192.168.1.1"}]}]}
         base._encrypted_load = lambda: new_fmt
         base.load_config()
-        assert base.config_data == new_fmt
\ No newline at end of file
+        assert base.config_data == new_fmt
+
+    def test_load_config_reuses_cached_parse(self, temp_config_file):
+        """Test load_config skips json parsing while the file is unchanged."""
+        first = ConcreteBaseSSHMenuC(temp_config_file)
+        first.load_config()
+        second = ConcreteBaseSSHMenuC(temp_config_file)
+        with patch("sshmenuc.utils.serialization.loads") as mock_load:
+            second.load_config()
+        mock_load.assert_not_called()
+        assert second.config_data == first.config_data
+
+    @pytest.mark.parametrize("content", ["", "{}"])
+    def test_load_config_trivial_file_skips_parse(self, tmp_path, content):
+        """Test an empty or '{}' config file loads as empty config without parsing."""
+        path = tmp_path / "config.json"
+        path.write_text(content)
+        base = ConcreteBaseSSHMenuC(str(path))
+        with patch("sshmenuc.utils.serialization.loads") as mock_load:
+            base.load_config()
+        mock_load.assert_not_called()
+        assert base.config_data == {"targets": []}
+
+    def test_load_config_reparses_after_external_change(self, temp_config_file):
+        """Test load_config picks up edits made to the file by other programs."""
+        base = ConcreteBaseSSHMenuC(temp_config_file)
+        base.load_config()
+        with open(temp_config_file, "w") as f:
+            json.dump({"targets": [{"Edited": []}]}, f)
+        st = os.stat(temp_config_file)
+        os.utime(temp_config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        base.load_config()
+        assert base.config_data == {"targets": [{"Edited": []}]}
+
+    def test_save_config_refreshes_cache(self, temp_config_file):
+        """Test a reload after save_config returns the saved data."""
+        base = ConcreteBaseSSHMenuC(temp_config_file)
+        base.load_config()
+        base.config_data = {"targets": [{"Saved": []}]}
+        base.save_config()
+        other = ConcreteBaseSSHMenuC(temp_config_file)
+        other.load_config()
+        assert other.config_data == {"targets": [{"Saved": []}]}
+
+    def test_unsaved_edit_not_shared_with_other_instances(self, temp_config_file):
+        """Test an in-place edit stays private until it is saved."""
+        first = ConcreteBaseSSHMenuC(temp_config_file)
+        first.load_config()
+        first.config_data["targets"].append({"Staging": []})
+
+        second = ConcreteBaseSSHMenuC(temp_config_file)
+        second.load_config()
+        assert {"Staging": []} not in second.config_data["targets"]
+        first.load_config()
+        assert {"Staging": []} not in first.config_data["targets"]
+
+    def test_failed_save_keeps_disk_state_on_reload(self, temp_config_file):
+        """Test a config whose save failed is reloaded as it is on disk."""
+        base = ConcreteBaseSSHMenuC(temp_config_file)
+        base.load_config()
+        base.config_data["targets"].append({"Staging": []})
+        with patch("sshmenuc.utils.serialization.dump_file", side_effect=OSError("disk full")):
+            base.save_config()
+
+        base.load_config()
+        assert {"Staging": []} not in base.config_data["targets"]
@@ -2,6 +2,7 @@
 Tests for ConnectionManager class.
 """
 import pytest
+from unittest.mock import patch
 from sshmenuc.core.config import ConnectionManager
 
 
@@ -66,6 +67,59 @@ class TestConnectionManager:
         assert len(manager.config_data["targets"]) == 1
         assert "ToKeep" in manager.config_data["targets"][0]
     
+    def test_find_target_after_rename_and_delete(self):
+        """Test target lookups follow renames and deletions."""
+        manager = ConnectionManager()
+        manager.create_target("A", [])
+        manager.create_target("B", [])
+        assert manager._find_target("B") is manager.config_data["targets"][1]
+
+        manager.modify_target("A", new_target_name="C")
+        assert manager._find_target("A") is None
+        assert manager._find_target("C") is manager.config_data["targets"][0]
+
+        manager.delete_target("B")
+        assert manager._find_target("B") is None
+
+    def test_find_target_sees_replaced_or_extended_targets(self):
+        """Test the lookup index is rebuilt when targets change outside the manager."""
+        manager = ConnectionManager()
+        manager.create_target("A", [])
+        assert manager._find_target("A") is not None
+
+        manager.config_data["targets"].append({"X": []})
+        assert manager._find_target("X") is manager.config_data["targets"][1]
+
+        manager.set_config({"targets": [{"Y": []}]})
+        assert manager._find_target("A") is None
+        assert manager._find_target("Y") is not None
+
+    def test_has_global_hosts_follows_connection_edits(self):
+        """Test has_global_hosts follows connection CRUD."""
+        manager = ConnectionManager()
+        manager.create_target("T", [])
+        assert manager.has_global_hosts() is False
+        manager.create_connection("T", "web", "web.com")
+        assert manager.has_global_hosts() is True
+        manager.delete_connection("T", 0)
+        assert manager.has_global_hosts() is False
+
+    def test_find_target_duplicate_names_returns_first(self):
+        """Test duplicate target names resolve to the first one, as before."""
+        manager = ConnectionManager()
+        manager.config_data = {"targets": [{"Dup": [1]}, {"Dup": [2]}]}
+        assert manager._find_target("Dup")["Dup"] == [1]
+
+    def test_has_target(self):
+        """Test has_target follows creation, rename and deletion."""
+        manager = ConnectionManager()
+        manager.config_data = {"targets": [{"A": []}]}
+        assert manager.has_target("A") and not manager.has_target("B")
+        manager.modify_target("A", new_target_name="B")
+        assert manager.has_target("B") and not manager.has_target("A")
+        manager.delete_target("B")
+        assert not manager.has_target("B")
+
     def test_create_connection(self):
         """Test creating a connection in a target."""
         manager = ConnectionManager()
@@ -229,4 +283,47 @@ class TestPathBasedOperations:
     def test_search_hosts_case_insensitive(self):
         m = self._manager_with_nested()
         results = m.search_hosts("NN-01")
-        assert len(results) == 1
\ No newline at end of file
+        assert len(results) == 1
+
+    def test_search_hosts_keeps_config_order(self):
+        m = ConnectionManager()
+        m.config_data = {"targets": [
+            {"A": [
+                {"friendly": "a-01", "host": "a1"},
+                {"Sub": [{"friendly": "s-01", "host": "s1"}]},
+                {"friendly": "a-02", "host": "a2"},
+            ]},
+            {"B": [{"friendly": "b-01", "host": "b1"}]},
+        ]}
+        results = m.search_hosts("")
+        assert [(b, h["friendly"]) for b, h in results] == [
+            ("A", "a-01"), ("A > Sub", "s-01"), ("A", "a-02"), ("B", "b-01")
+        ]
+
+    def test_search_hosts_deep_nesting(self):
+        m = ConnectionManager()
+        node = [{"friendly": "deep", "host": "deep.local"}]
+        for _ in range(2000):
+            node = [{"G": node}]
+        m.config_data = {"targets": [{"Root": node}]}
+        results = m.search_hosts("deep")
+        assert len(results) == 1
+
+    def test_reinstantiation_reuses_parsed_config(self, temp_config_file):
+        """Test a second manager on an unchanged file gets its own copy without parsing again."""
+        first = ConnectionManager(temp_config_file)
+        with patch("sshmenuc.utils.serialization.loads") as mock_load:
+            second = ConnectionManager(temp_config_file)
+        mock_load.assert_not_called()
+        assert second.config_data == first.config_data
+        assert second.config_data is not first.config_data
+
+    def test_add_connection(self):
+        """Test add_connection appends to an existing target only."""
+        manager = ConnectionManager()
+        manager.config_data = {"targets": [{"A": []}]}
+        assert manager.has_global_hosts() is False
+        assert manager.add_connection("A", {"friendly": "x", "host": "x"}) is True
+        assert manager.config_data["targets"][0]["A"] == [{"friendly": "x", "host": "x"}]
+        assert manager.has_global_hosts() is True
+        assert manager.add_connection("Missing", {"friendly": "y", "host": "y"}) is False
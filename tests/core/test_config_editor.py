@@ -0,0 +1,77 @@
+"""
+Tests for ConfigEditor class.
+"""
+import pytest
+from unittest.mock import patch
+from sshmenuc.core.config import ConnectionManager
+from sshmenuc.core.config_editor import ConfigEditor
+
+
+class TestConfigEditorConfirm:
+
+    @pytest.mark.parametrize("key,expected", [("y", True), ("Y", True), ("n", False), ("\r", False)])
+    def test_confirm_reads_single_key(self, key, expected):
+        """Test confirm() answers on one keypress, without waiting for Enter."""
+        editor = ConfigEditor(ConnectionManager())
+        with patch("readchar.readkey", return_value=key) as mock_readkey, \
+             patch("builtins.input") as mock_input:
+            assert editor.confirm("Delete?") is expected
+        mock_readkey.assert_called_once()
+        mock_input.assert_not_called()
+
+    def test_confirm_pasted_line_uses_first_key(self):
+        """Test a pasted burst answers with its first key and the rest is dropped."""
+        editor = ConfigEditor(ConnectionManager())
+        with patch("sshmenuc.ui.keyboard.read_keys", return_value=["y", "e", "s"]) as mock_read_keys:
+            assert editor.confirm("Delete?") is True
+        mock_read_keys.assert_called_once()
+
+
+class TestConfigEditorEditConnection:
+
+    def test_edit_without_changes_skips_save(self, temp_config_file):
+        """Test accepting every default leaves the config untouched and unsaved."""
+        manager = ConnectionManager(temp_config_file)
+        connection = manager.get_node_at_path([0])[0]
+        before = dict(connection)
+        editor = ConfigEditor(manager)
+        with patch("sshmenuc.core.base.BaseSSHMenuC.save_config") as mock_save, \
+             patch("builtins.input", return_value=""):
+            assert editor.edit_connection_at_path([0], 0, connection) is False
+            assert editor.edit_connection("Production", 0, connection) is False
+        mock_save.assert_not_called()
+        assert connection == before
+
+    def test_edit_with_change_saves(self, temp_config_file):
+        """Test a changed field is applied and saved."""
+        manager = ConnectionManager(temp_config_file)
+        connection = manager.get_node_at_path([0])[0]
+        editor = ConfigEditor(manager)
+        with patch("sshmenuc.core.base.BaseSSHMenuC.save_config") as mock_save, \
+             patch("builtins.input", side_effect=["", "", "", "", "", "web,prod"]):
+            assert editor.edit_connection_at_path([0], 0, connection) is True
+        mock_save.assert_called_once()
+        assert connection["tags"] == ["web", "prod"]
+
+
+class TestConfigEditorAddConnection:
+
+    def test_add_connection_to_target(self, temp_config_file):
+        """Test the form result is appended to the named target and saved."""
+        manager = ConnectionManager(temp_config_file)
+        editor = ConfigEditor(manager)
+        answers = ["db", "db.example.com", "", "", "", "", ""]
+        with patch("sshmenuc.core.base.BaseSSHMenuC.save_config") as mock_save, \
+             patch("builtins.input", side_effect=answers):
+            assert editor.add_connection("Development") is True
+        mock_save.assert_called_once()
+        assert manager.get_node_at_path([1])[-1]["host"] == "db.example.com"
+
+    def test_add_connection_unknown_target(self, temp_config_file):
+        """Test an unknown target is reported and nothing is saved."""
+        editor = ConfigEditor(ConnectionManager(temp_config_file))
+        answers = ["db", "db.example.com", "", "", "", "", ""]
+        with patch("sshmenuc.core.base.BaseSSHMenuC.save_config") as mock_save, \
+             patch("builtins.input", side_effect=answers):
+            assert editor.add_connection("Missing") is False
+        mock_save.assert_not_called()
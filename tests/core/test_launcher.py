@@ -3,7 +3,7 @@ Tests for SSHLauncher class.
 """
 import pytest
 from unittest.mock import patch, MagicMock
-from sshmenuc.core.launcher import SSHLauncher
+from sshmenuc.core.launcher import SSHLauncher, _session_suffix, _tmux_info as real_tmux_info
 
 
 class TestSSHLauncher:
@@ -36,18 +36,59 @@ class TestSSHLauncher:
         
         # Test with spaces and symbols
         assert launcher._sanitize_session_name("test host & server") == "test-host-server"
+
+    @pytest.mark.parametrize("raw", [
+        "web.example.com-1739999999", "xn--80ak6aa92e.com", "a-.b..c::d",
+        "..leading", "trailing..", "nul\x00\x00byte", "été.fr", "", "fe80::1%eth0",
+    ])
+    def test_sanitize_session_name_matches_regex(self, raw):
+        """Test the translate fast path gives the same result as the regex."""
+        from sshmenuc.core.launcher import _SESSION_NAME_RE
+        assert SSHLauncher._sanitize_session_name(raw) == _SESSION_NAME_RE.sub("-", raw)
     
     @patch('subprocess.run')
     def test_list_tmux_sessions_success(self, mock_run):
         """Test listing tmux sessions successfully."""
         mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = "session1: 1 windows\nsession2: 2 windows\n"
+        mock_run.return_value.stdout = "session1\nsession2\n"
         
         launcher = SSHLauncher("test.com", "user")
         sessions = launcher._list_tmux_sessions()
         
         assert sessions == ["session1", "session2"]
+        assert mock_run.call_args[0][0] == ["tmux", "list-sessions", "-F", "#S"]
     
+    @patch('subprocess.run')
+    def test_list_tmux_sessions_prefix_filtered_by_tmux(self, mock_run):
+        """Test a prefix is passed to tmux as a -f filter."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="host-1\nhost-2\n", stderr="")
+
+        sessions = SSHLauncher("host", "user")._list_tmux_sessions("host-")
+
+        assert sessions == ["host-1", "host-2"]
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0][-2:] == ["-f", "#{m:host-*,#S}"]
+
+    @patch('subprocess.run')
+    def test_list_tmux_sessions_prefix_filtered_here_on_old_tmux(self, mock_run, tmux_probe):
+        """Test tmux without -f support gets the plain listing, filtered in Python."""
+        tmux_probe.side_effect = lambda: ("/usr/bin/tmux", (3, 0))
+        mock_run.return_value = MagicMock(returncode=0, stdout="host-1\nhostx-2\nother\n", stderr="")
+
+        sessions = SSHLauncher("host", "user")._list_tmux_sessions("host-")
+
+        assert sessions == ["host-1"]
+        mock_run.assert_called_once()
+        assert "-f" not in mock_run.call_args[0][0]
+
+    @patch('subprocess.run')
+    def test_list_tmux_sessions_prefix_no_server(self, mock_run):
+        """Test no running server returns nothing."""
+        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="no server running on /tmp/tmux")
+
+        assert SSHLauncher("host", "user")._list_tmux_sessions("host-") == []
+        mock_run.assert_called_once()
+
     @patch('subprocess.run')
     def test_list_tmux_sessions_failure(self, mock_run):
         """Test listing tmux sessions when tmux fails."""
@@ -107,8 +148,8 @@ class TestSSHLauncher:
         assert result is False
     
     @patch('subprocess.run')
-    @patch('builtins.input', return_value='a')
-    def test_handle_existing_sessions_single_attach(self, mock_input, mock_run):
+    @patch('readchar.readkey', return_value='a')
+    def test_handle_existing_sessions_single_attach(self, mock_readkey, mock_run):
         """Test handling single existing session with attach choice."""
         launcher = SSHLauncher("test.com", "user")
         launcher._list_tmux_sessions = MagicMock(return_value=["test-com-123"])
@@ -117,6 +158,29 @@ class TestSSHLauncher:
         assert result is True
         mock_run.assert_called_once()
     
+    @patch('subprocess.run')
+    @patch('readchar.readkey', return_value='\r')
+    def test_handle_existing_sessions_single_enter_attaches(self, mock_readkey, mock_run):
+        """Test Enter at the single-session prompt attaches without waiting for a line."""
+        launcher = SSHLauncher("test.com", "user")
+        launcher._list_tmux_sessions = MagicMock(return_value=["test-com-123"])
+
+        with patch('builtins.input') as mock_input:
+            assert launcher._handle_existing_sessions("test-com") is True
+        mock_input.assert_not_called()
+        mock_readkey.assert_called_once()
+
+    @patch('subprocess.run')
+    @patch('sshmenuc.ui.keyboard.read_keys', return_value=['n', 'o', 'p', 'e'])
+    def test_handle_existing_sessions_pasted_line_uses_first_key(self, mock_read_keys, mock_run):
+        """Test a pasted burst answers with its first key and the rest is dropped."""
+        launcher = SSHLauncher("test.com", "user")
+        launcher._list_tmux_sessions = MagicMock(return_value=["test-com-123"])
+
+        assert launcher._handle_existing_sessions("test-com") is False
+        mock_read_keys.assert_called_once()
+        mock_run.assert_not_called()
+
     @patch('shutil.which')
     @patch('subprocess.run')
     @patch('logging.getLogger')
@@ -162,8 +226,14 @@ class TestSSHLauncher:
         hosts = [{"host": f"host{i}.com", "user": "user"} for i in range(8)]
         SSHLauncher.launch_group(hosts)
 
-        # Should be called 4 times: new-session + 5 split-window + select-layout + attach-session
-        assert mock_run.call_count == 8
+        # One tmux call builds the session (new-session + 5 split-window + select-layout),
+        # one attaches to it
+        assert mock_run.call_count == 2
+        setup = mock_run.call_args_list[0][0][0]
+        assert setup.count("split-window") == 5
+        assert setup.count(";") == 6
+        assert setup[-4:] == ["select-layout", "-t", setup[3], "tiled"]
+        assert mock_run.call_args_list[1][0][0][:2] == ["tmux", "attach-session"]
 
     @patch('subprocess.run')
     @patch('shutil.which')
@@ -190,7 +260,7 @@ class TestSSHLauncher:
         mock_which.return_value = '/usr/bin/tmux'
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="host-123: 1 windows\nhost-456: 1 windows\n"
+            stdout="host-123\nhost-456\n"
         )
         mock_input.return_value = "0"  # Select first session
 
@@ -207,7 +277,7 @@ class TestSSHLauncher:
         mock_which.return_value = '/usr/bin/tmux'
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="host-123: 1 windows\nhost-456: 1 windows\n"
+            stdout="host-123\nhost-456\n"
         )
         mock_input.return_value = ""  # Press enter to create new
 
@@ -259,8 +329,8 @@ class TestSSHLauncher:
         ]
         SSHLauncher.launch_group(hosts)
 
-        # Should be called: new-session + split-window + select-layout + attach-session
-        assert mock_run.call_count == 4
+        # Should be called: new-session ; split-window ; select-layout, then attach-session
+        assert mock_run.call_count == 2
 
     @patch('subprocess.run')
     @patch('shutil.which')
@@ -279,11 +349,94 @@ class TestSSHLauncher:
 
     @patch('subprocess.run')
     @patch('shutil.which')
-    @patch('builtins.input', return_value='n')
-    def test_handle_existing_sessions_single_decline(self, mock_input, mock_which, mock_run):
+    @patch('readchar.readkey', return_value='n')
+    def test_handle_existing_sessions_single_decline(self, mock_readkey, mock_which, mock_run):
         """Test handling single existing session - decline attach."""
         launcher = SSHLauncher("test.com", "user")
         launcher._list_tmux_sessions = MagicMock(return_value=["test-com-123"])
 
         result = launcher._handle_existing_sessions("test-com")
-        assert result is False
\ No newline at end of file
+        assert result is False
+
+    @pytest.mark.parametrize("output,version", [
+        ("tmux 3.3a\n", (3, 3)), ("tmux next-3.4\n", (3, 4)), ("tmux 2.6\n", (2, 6)), ("tmux master\n", None),
+    ])
+    def test_tmux_probe_reads_version_once(self, output, version):
+        """Test the probe searches $PATH and runs "tmux -V" only once per process."""
+        real_tmux_info.cache_clear()
+        try:
+            with patch('shutil.which', return_value='/usr/bin/tmux') as mock_which, \
+                 patch('subprocess.run', return_value=MagicMock(stdout=output)) as mock_run:
+                assert real_tmux_info() == ('/usr/bin/tmux', version)
+                assert real_tmux_info() == ('/usr/bin/tmux', version)
+            mock_which.assert_called_once_with("tmux")
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0] == ['/usr/bin/tmux', '-V']
+        finally:
+            real_tmux_info.cache_clear()
+
+    def test_tmux_probe_without_tmux(self):
+        """Test a missing tmux is reported without running anything."""
+        real_tmux_info.cache_clear()
+        try:
+            with patch('shutil.which', return_value=None), patch('subprocess.run') as mock_run:
+                assert real_tmux_info() == (None, None)
+            mock_run.assert_not_called()
+        finally:
+            real_tmux_info.cache_clear()
+
+    def test_tmux_command_args_quoted_string_on_old_tmux(self, tmux_probe):
+        """Test tmux before 3.0 gets one shell-quoted command string."""
+        tmux_probe.side_effect = lambda: ("/usr/bin/tmux", (2, 9))
+        from sshmenuc.core.launcher import _tmux_command_args
+        assert _tmux_command_args(["ssh", "u@h", "echo a;"]) == ["ssh u@h 'echo a;'"]
+
+    @patch('subprocess.run')
+    @patch('shutil.which', return_value='/usr/bin/tmux')
+    @patch('sshmenuc.utils.helpers.get_current_user', return_value='me')
+    def test_launch_group_resolves_default_user_lazily(self, mock_user, mock_which, mock_run):
+        """Test the current user is looked up only for hosts without a user."""
+        SSHLauncher.launch_group([{"host": "h1", "user": "u1"}, {"host": "h2", "user": "u2"}])
+        mock_user.assert_not_called()
+
+        SSHLauncher.launch_group([{"host": "h1"}, {"host": "h2", "user": "u2"}, {"host": "h3"}])
+        assert mock_user.call_count == 2
+        cmds = " ".join(" ".join(c[0][0]) for c in mock_run.call_args_list)
+        assert "me@h1" in cmds and "u2@h2" in cmds and "me@h3" in cmds
+
+    def test_tmux_command_args_pass_argv_unquoted(self):
+        """Test commands go to tmux as argv after "--", without shell quoting."""
+        from sshmenuc.core.launcher import _tmux_command_args
+        assert _tmux_command_args(["ssh", "user@h", "echo a b"]) == ["--", "ssh", "user@h", "echo a b"]
+
+    def test_tmux_command_args_escape_trailing_semicolon(self):
+        """Test a trailing ";" is escaped so tmux does not read it as a separator."""
+        from sshmenuc.core.launcher import _tmux_command_args
+        assert _tmux_command_args(["sh", "-c", "true;", "x\\;"]) == ["--", "sh", "-c", "true\\;", "x\\\\;"]
+
+    @patch('subprocess.run')
+    def test_create_new_tmux_session_passes_argv(self, mock_run):
+        """Test the ssh command is passed to new-session as separate arguments."""
+        launcher = SSHLauncher("host.com", "user", extra_args="-t 'tail -f log'")
+        launcher._create_new_tmux_session(launcher._build_ssh_command())
+
+        args = mock_run.call_args[0][0]
+        assert args[:3] == ["tmux", "new-session", "-s"]
+        assert args[4:] == ["--", "ssh", "user@host.com", "-p", "22", "-t", "tail -f log"]
+
+
+class TestSessionSuffix:
+    """Test cases for the session name suffix."""
+
+    def test_base36_milliseconds(self):
+        """Test suffix is the millisecond timestamp in base 36."""
+        with patch("sshmenuc.core.launcher.time.time_ns", return_value=1_700_000_000_123_456_789):
+            suffix = _session_suffix()
+        assert int(suffix, 36) == 1_700_000_000_123
+        assert len(suffix) == 8
+        assert suffix == suffix.lower()
+
+    def test_suffix_survives_sanitizing(self):
+        """Test suffix only uses characters allowed in session names."""
+        suffix = _session_suffix()
+        assert SSHLauncher._sanitize_session_name(suffix) == suffix
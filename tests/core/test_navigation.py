@@ -184,6 +184,159 @@ class TestConnectionNavigator:
         mock_print_instructions.assert_called_once()
         mock_print_table.assert_called_once()
 
+    def test_build_breadcrumb_nested(self, temp_config_file):
+        """Test breadcrumb names every group along the path."""
+        navigator = ConnectionNavigator(temp_config_file)
+        navigator.set_config({"targets": [{"HDP": [{"Prod": [{"friendly": "a", "host": "a"}]}]}]})
+
+        assert navigator._build_breadcrumb([]) == ""
+        assert navigator._build_breadcrumb([0, 0]) == "HDP > Prod"
+
+    def test_build_breadcrumb_cache_reset_on_set_config(self, temp_config_file):
+        """Test cached breadcrumbs are dropped when the config changes."""
+        navigator = ConnectionNavigator(temp_config_file)
+        assert navigator._build_breadcrumb([0]) == "Production"
+
+        navigator.set_config({"targets": [{"Staging": []}]})
+        assert navigator._build_breadcrumb([0]) == "Staging"
+
+    @patch('sshmenuc.ui.display.MenuDisplay.repaint_rows', return_value=True)
+    @patch('sshmenuc.ui.display.MenuDisplay.clear_screen')
+    @patch('sshmenuc.ui.display.MenuDisplay.print_instructions')
+    @patch('sshmenuc.ui.display.MenuDisplay.print_table')
+    def test_print_menu_repaints_selection_only(self, mock_print_table, mock_print_instructions,
+                                                mock_clear_screen, mock_repaint, temp_config_file):
+        """Test moving the selection repaints rows instead of redrawing the screen."""
+        navigator = ConnectionNavigator(temp_config_file)
+        navigator.print_menu(0, [])
+        navigator.print_menu(1, [])
+
+        mock_clear_screen.assert_called_once()
+        mock_print_table.assert_called_once()
+        mock_repaint.assert_called_once_with(navigator.get_node([]), {0, 1}, 1, navigator.marked_indices)
+
+    @patch('sshmenuc.ui.display.MenuDisplay.repaint_rows', return_value=True)
+    @patch('sshmenuc.ui.display.MenuDisplay.clear_screen')
+    @patch('sshmenuc.ui.display.MenuDisplay.print_instructions')
+    @patch('sshmenuc.ui.display.MenuDisplay.print_table')
+    def test_print_menu_repaints_toggled_mark_only(self, mock_print_table, mock_print_instructions,
+                                                   mock_clear_screen, mock_repaint, temp_config_file):
+        """Test marking a host repaints its row instead of redrawing the screen."""
+        navigator = ConnectionNavigator(temp_config_file)
+        navigator.print_menu(0, [0])
+        navigator._handle_selection([0], 0)
+        navigator.print_menu(0, [0])
+
+        mock_clear_screen.assert_called_once()
+        mock_print_table.assert_called_once()
+        mock_repaint.assert_called_once_with(navigator.get_node([0]), {0}, 0, {0})
+
+    @patch('sshmenuc.ui.display.MenuDisplay.repaint_rows')
+    @patch('sshmenuc.ui.display.MenuDisplay.clear_screen')
+    @patch('sshmenuc.ui.display.MenuDisplay.print_instructions')
+    @patch('sshmenuc.ui.display.MenuDisplay.print_table')
+    def test_print_menu_full_redraw_on_path_change(self, mock_print_table, mock_print_instructions,
+                                                   mock_clear_screen, mock_repaint, temp_config_file):
+        """Test changing the path always redraws the whole menu."""
+        navigator = ConnectionNavigator(temp_config_file)
+        navigator.print_menu(0, [])
+        navigator.print_menu(0, [0])
+
+        assert mock_clear_screen.call_count == 2
+        mock_repaint.assert_not_called()
+
+    def test_aggregated_targets_reused_between_calls(self, temp_config_file):
+        """Test top-level targets are merged once per config, not per get_node() call."""
+        navigator = ConnectionNavigator(temp_config_file)
+        root = navigator.get_node([])
+        assert navigator.get_node([]) is root
+        assert navigator.get_previous_node([0]) is root
+
+    def test_aggregated_targets_follow_config_changes(self, temp_config_file):
+        """Test the merged targets are rebuilt when the config is replaced."""
+        navigator = ConnectionNavigator(temp_config_file)
+        navigator.get_node([])
+
+        navigator.set_config({"targets": [{"Staging": []}, {"QA": [{"friendly": "q", "host": "q"}]}]})
+        assert list(navigator.get_node([])) == ["Staging", "QA"]
+        assert navigator.get_node([1]) == [{"friendly": "q", "host": "q"}]
+
+        navigator.config_data = {"targets": [{"Other": []}]}  # Replaced without set_config()
+        assert list(navigator.get_node([])) == ["Other"]
+
+    def test_get_node_cached_per_path(self, temp_config_file):
+        """Test a path is walked once until the config is reloaded."""
+        navigator = ConnectionNavigator(temp_config_file)
+        with patch.object(ConnectionNavigator, '_walk', wraps=ConnectionNavigator._walk) as mock_walk:
+            node = navigator.get_node([0])
+            assert navigator.get_node([0]) is node
+            navigator.count_elements([0])
+            assert mock_walk.call_count == 1
+
+            navigator.load_config()
+            navigator.get_node([0])
+            assert mock_walk.call_count == 2
+
+    def test_get_node_cache_cleared_on_set_config(self, temp_config_file):
+        """Test cached nodes are not served after the config is replaced."""
+        navigator = ConnectionNavigator(temp_config_file)
+        navigator.get_node([0])
+        navigator.set_config({"targets": [{"Staging": [{"friendly": "s", "host": "s"}]}]})
+        assert navigator.get_node([0]) == [{"friendly": "s", "host": "s"}]
+
+    def test_view_computed_once_per_path(self, temp_config_file):
+        """Test node, item count and level are derived once per path."""
+        navigator = ConnectionNavigator(temp_config_file)
+        view = navigator._view([0])
+        assert view == (navigator.get_node([0]), 1, 2)
+        assert navigator._view([0]) is view
+        assert navigator.count_elements([]) == 2
+
+        navigator.load_config()
+        assert navigator._view([0]) is not view
+
+    @patch('sshmenuc.ui.display.MenuDisplay.clear_screen')
+    @patch('sshmenuc.ui.display.MenuDisplay.print_instructions')
+    @patch('sshmenuc.ui.display.MenuDisplay.print_table')
+    @patch('sshmenuc.core.navigation.logging.debug')
+    def test_print_menu_skips_debug_logging(self, mock_debug, mock_print_table, mock_print_instructions,
+                                            mock_clear_screen, temp_config_file):
+        """Test the node is not logged when debug logging is off."""
+        navigator = ConnectionNavigator(temp_config_file)
+        with patch('logging.Logger.isEnabledFor', return_value=False):
+            navigator.print_menu(0, [])
+        mock_debug.assert_not_called()
+        mock_print_table.assert_called_once_with(navigator.get_node([]), 0, navigator.marked_indices, 0)
+
+    def test_target_name_by_position(self, temp_config_file):
+        """Test root positions map to target names, out of range gives None."""
+        navigator = ConnectionNavigator(temp_config_file)
+        assert navigator._target_name(0) == "Production"
+        assert navigator._target_name(1) == "Development"
+        assert navigator._target_name(2) is None
+        assert navigator._target_name(-1) is None
+
+    @patch('builtins.input', return_value="")
+    def test_delete_target_uses_cached_name(self, mock_input, temp_config_file):
+        """Test deleting at the root passes the selected target name to the editor."""
+        navigator = ConnectionNavigator(temp_config_file)
+        with patch.object(navigator.editor, 'delete_target', return_value=False) as mock_delete:
+            navigator._handle_delete([], 1)
+        mock_delete.assert_called_once_with("Development")
+
+    def test_get_node_out_of_range_target(self, temp_config_file):
+        """Test an invalid first index returns the root node."""
+        navigator = ConnectionNavigator(temp_config_file)
+        assert navigator.get_node([99]) is navigator.get_node([])
+
+    def test_reload_config_shares_parsed_data(self, temp_config_file):
+        """Test the config is loaded once and handed to the connection manager."""
+        navigator = ConnectionNavigator(temp_config_file)
+        with patch.object(navigator.config_manager, 'load_config') as mock_load:
+            navigator._reload_config()
+            mock_load.assert_not_called()
+        assert navigator.config_manager.config_data is navigator.config_data
+
 
 class TestContextManagement:
     """Tests for context management methods: _switch_to_context, _handle_context_manage,
@@ -232,6 +385,22 @@ class TestContextManagement:
         assert nav._active_context == "isp"
         ctx_mgr.set_active.assert_called_once_with("isp")
 
+    def test_switch_to_context_binds_save_hook(self, temp_config_file):
+        """After a switch, saves push through the new context's SyncManager."""
+        nav, ctx_mgr = self._make_navigator_with_context_manager(temp_config_file)
+
+        from sshmenuc.sync import SyncState
+        mock_sm = MagicMock()
+        mock_sm.startup_pull.return_value = SyncState.SYNC_OK
+        mock_sm.get_config_data.return_value = None
+
+        with patch("sshmenuc.core.navigation.SyncManager", return_value=mock_sm):
+            nav._switch_to_context("isp")
+
+        assert nav.config_manager._post_save_hook == mock_sm.post_save_push
+        nav.config_manager._on_config_saved()
+        mock_sm.post_save_push.assert_called_once()
+
     def test_switch_to_context_failure(self, temp_config_file):
         """_switch_to_context returns False and keeps previous context when pull fails."""
         nav, ctx_mgr = self._make_navigator_with_context_manager(temp_config_file)
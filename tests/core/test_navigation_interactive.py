@@ -53,6 +53,60 @@ class TestNavigationInteractive:
 
         assert mock_print_menu.call_count == 3
 
+    @patch('sshmenuc.core.navigation.read_keys')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator.print_menu')
+    def test_navigate_arrow_burst_single_redraw(self, mock_print_menu, mock_read_keys, multi_category_config_file):
+        """Test arrow keys read in one burst are applied before a single redraw."""
+        mock_read_keys.side_effect = [[readchar.key.DOWN, readchar.key.DOWN, readchar.key.UP], ['q', 'y']]
+        navigator = ConnectionNavigator(multi_category_config_file)
+        navigator.navigate()
+
+        assert mock_print_menu.call_count == 2
+        assert mock_print_menu.call_args_list[1].args[0] == 1
+
+    @patch('sshmenuc.core.navigation.cooked')
+    @patch('sshmenuc.core.navigation.cbreak')
+    @patch('sshmenuc.core.navigation.read_keys')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator._handle_sync_status')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator.print_menu')
+    def test_navigate_holds_cbreak_and_prompts_in_cooked_mode(self, mock_print_menu, mock_sync_status,
+                                                              mock_read_keys, mock_cbreak, mock_cooked,
+                                                              multi_category_config_file):
+        """Test cbreak mode spans the session and only prompting handlers leave it."""
+        mock_read_keys.side_effect = [[readchar.key.DOWN], [], ['s'], ['q', 'y']]
+        mock_cooked.return_value.__enter__.side_effect = lambda: mock_sync_status.assert_not_called()
+        navigator = ConnectionNavigator(multi_category_config_file)
+        navigator.navigate()
+
+        mock_cbreak.assert_called_once()
+        mock_cbreak.return_value.__exit__.assert_called_once()
+        mock_cooked.assert_called_once()
+        mock_sync_status.assert_called_once()
+
+    @patch('sshmenuc.core.navigation.read_keys')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator.print_menu')
+    def test_navigate_arrows_typed_during_burst_join_it(self, mock_print_menu, mock_read_keys,
+                                                        multi_category_config_file):
+        """Test arrows arriving while a burst is applied are drawn in the same redraw."""
+        mock_read_keys.side_effect = [[readchar.key.DOWN], [readchar.key.DOWN], [], ['q', 'y']]
+        navigator = ConnectionNavigator(multi_category_config_file)
+        navigator.navigate()
+
+        assert mock_print_menu.call_count == 2
+        assert mock_print_menu.call_args_list[1].args[0] == 2
+        assert mock_read_keys.call_args_list[1].kwargs == {"wait": False}
+
+    @patch('readchar.readkey')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator.print_menu')
+    def test_navigate_unbound_keys_skip_redraw(self, mock_print_menu, mock_readkey, temp_config_file):
+        """Test keys without a binding neither redraw the menu nor drop the fast repaint."""
+        mock_readkey.side_effect = ['z', '9', readchar.key.DOWN, 'q', 'y']
+        navigator = ConnectionNavigator(temp_config_file)
+        navigator.navigate()
+
+        assert mock_print_menu.call_count == 2
+        assert mock_print_menu.call_args_list[1].args[0] == 1
+
     @patch('readchar.readkey')
     @patch('sshmenuc.core.navigation.ConnectionNavigator.print_menu')
     def test_navigate_up_key(self, mock_print_menu, mock_readkey, temp_config_file):
@@ -140,6 +194,33 @@ class TestNavigationInteractive:
 
         mock_handle_rename.assert_called_once()
 
+    @patch('readchar.readkey')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator._search_mode')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator._handle_context_manage')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator.print_menu')
+    def test_navigate_context_key_needs_context_manager(self, mock_print_menu, mock_manage, mock_search,
+                                                        mock_readkey, temp_config_file):
+        """Test 'c' is ignored in single-file mode while '/' still dispatches."""
+        mock_readkey.side_effect = ['c', '/', 'q', 'y']
+        navigator = ConnectionNavigator(temp_config_file)
+        navigator.navigate()
+
+        mock_manage.assert_not_called()
+        mock_search.assert_called_once_with()
+
+    @patch('readchar.readkey')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator._handle_context_manage')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator.print_menu')
+    def test_navigate_context_key_with_context_manager(self, mock_print_menu, mock_manage, mock_readkey,
+                                                       temp_config_file):
+        """Test 'c' opens context management when a ContextManager is wired."""
+        mock_readkey.side_effect = ['c', 'q', 'y']
+        navigator = ConnectionNavigator(temp_config_file)
+        navigator._context_manager = MagicMock()
+        navigator.navigate()
+
+        mock_manage.assert_called_once_with()
+
     @patch('sshmenuc.core.navigation.puts')
     def test_launch_multiple_hosts_no_valid(self, mock_puts, temp_config_file):
         """Test launching multiple hosts with no valid hosts selected."""
@@ -170,6 +251,21 @@ class TestNavigationInteractive:
         assert len(navigator.marked_indices) == 0
 
 
+    @patch('sshmenuc.core.navigation.read_keys')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator._handle_add')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator.print_menu')
+    def test_keys_queued_behind_launch_are_dropped(self, mock_print_menu, mock_handle_add, mock_read_keys,
+                                                   multi_category_config_file):
+        """Test keys read in the burst of the Enter that launches ssh are not replayed afterwards."""
+        mock_read_keys.side_effect = [[readchar.key.ENTER, readchar.key.ENTER, 'a'], ['q', 'y']]
+        navigator = ConnectionNavigator(multi_category_config_file)
+        with patch('sshmenuc.core.navigation.SSHLauncher') as mock_launcher:
+            navigator.navigate()
+
+        mock_launcher.return_value.launch.assert_called_once()
+        mock_handle_add.assert_not_called()
+
+
 class TestCursorReset:
     """Tests for issue #3: cursor must reset to 0 when entering a sub-menu."""
 
@@ -447,3 +543,15 @@ class TestSearchMode:
             mock_launcher.return_value.launch = MagicMock()
             navigator.navigate()
             mock_launcher.assert_called_once()
+
+    @patch('sshmenuc.core.navigation.read_keys')
+    @patch('sshmenuc.core.navigation.ConnectionNavigator.print_menu')
+    def test_search_pasted_query_single_redraw(self, mock_print_menu, mock_read_keys, tagged_config_file):
+        """A query pasted in one read is filtered and drawn once, not per character."""
+        mock_read_keys.side_effect = [['/', 'n', 'n', '-', '0', '1'], ['\x1b'], ['q', 'y']]
+        navigator = ConnectionNavigator(tagged_config_file)
+        with patch.object(navigator.display, 'clear_screen') as mock_clear:
+            navigator.navigate()
+
+        # Initial empty-query screen is skipped too: keys were already queued
+        assert mock_clear.call_count == 1
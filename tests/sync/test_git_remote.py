@@ -123,6 +123,48 @@ class TestPullRemote:
         result = pull_remote(SYNC_CFG)
         assert result.status == PullStatus.OFFLINE
 
+    @patch("sshmenuc.sync.git_remote._run_git")
+    def test_non_interactive_fetch_disables_prompts(self, mock_git):
+        mock_git.return_value = _make_run_result(returncode=1, stderr="Host key verification failed")
+        with patch.dict(os.environ, {"GIT_SSH_COMMAND": "ssh -i key"}):
+            result = pull_remote(SYNC_CFG, interactive=False)
+        assert result.status == PullStatus.OFFLINE
+        assert result.prompt_refused is True
+        env = mock_git.call_args.kwargs["env"]
+        assert env["GIT_TERMINAL_PROMPT"] == "0"
+        assert env["GIT_SSH_COMMAND"] == "ssh -i key -o BatchMode=yes"
+
+    @patch("sshmenuc.sync.git_remote._run_git")
+    def test_non_interactive_fetch_uses_core_ssh_command(self, mock_git):
+        mock_git.side_effect = [
+            _make_run_result(returncode=0, stdout="ssh -F ~/.ssh/work\n"),  # config core.sshCommand
+            _make_run_result(returncode=1, stderr="Could not resolve hostname"),  # fetch
+        ]
+        with patch.dict(os.environ, {"GIT_SSH": "/usr/bin/other-ssh"}):
+            os.environ.pop("GIT_SSH_COMMAND", None)
+            result = pull_remote(SYNC_CFG, interactive=False)
+        assert result.prompt_refused is False
+        assert mock_git.call_args_list[0].args[0] == ["config", "core.sshCommand"]
+        assert mock_git.call_args.kwargs["env"]["GIT_SSH_COMMAND"] == "ssh -F ~/.ssh/work -o BatchMode=yes"
+
+    @patch("sshmenuc.sync.git_remote._run_git")
+    def test_non_interactive_fetch_falls_back_to_git_ssh(self, mock_git):
+        mock_git.side_effect = [
+            _make_run_result(returncode=1),  # config core.sshCommand: not set
+            _make_run_result(returncode=1, stderr="fatal: could not read Username: terminal prompts disabled"),
+        ]
+        with patch.dict(os.environ, {"GIT_SSH": "/opt/my ssh"}):
+            os.environ.pop("GIT_SSH_COMMAND", None)
+            result = pull_remote(SYNC_CFG, interactive=False)
+        assert result.prompt_refused is True
+        assert mock_git.call_args.kwargs["env"]["GIT_SSH_COMMAND"] == "'/opt/my ssh' -o BatchMode=yes"
+
+    @patch("sshmenuc.sync.git_remote._run_git")
+    def test_interactive_fetch_keeps_environment(self, mock_git):
+        mock_git.return_value = _make_run_result(returncode=1)
+        pull_remote(SYNC_CFG)
+        assert mock_git.call_args.kwargs["env"] is None
+
 
 class TestPushRemote:
     @patch("sshmenuc.sync.git_remote._run_git")
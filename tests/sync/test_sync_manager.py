@@ -115,6 +115,80 @@ class TestStartupPull:
         state = m.startup_pull()
         assert state == SyncState.SYNC_OK
 
+    @patch("sshmenuc.sync.sync_manager.has_passphrase", return_value=False)
+    @patch("sshmenuc.sync.sync_manager.pull_remote")
+    @patch("sshmenuc.sync.sync_manager.ensure_repo_initialized", return_value=True)
+    @patch("sshmenuc.sync.sync_manager.is_remote_reachable", return_value=True)
+    def test_fetch_runs_while_passphrase_is_prompted(self, mock_reach, mock_ensure, mock_pull,
+                                                    mock_has, make_manager):
+        """The git fetch starts before the passphrase prompt returns."""
+        import threading
+        fetch_started = threading.Event()
+
+        def fake_pull(cfg, interactive=True):
+            assert interactive is False  # Must not prompt on the passphrase's terminal
+            fetch_started.set()
+            return PullResult(status=PullStatus.NO_CHANGE)
+
+        def fake_prompt(prompt):
+            assert fetch_started.wait(5)
+            return PASSPHRASE
+
+        mock_pull.side_effect = fake_pull
+        m = make_manager(sync_cfg=SYNC_CFG)
+        with patch("sshmenuc.sync.sync_manager.get_or_prompt", side_effect=fake_prompt):
+            assert m.startup_pull() == SyncState.SYNC_OK
+        mock_pull.assert_called_once()
+
+    @patch("sshmenuc.sync.sync_manager.has_passphrase", return_value=False)
+    @patch("sshmenuc.sync.sync_manager.pull_remote")
+    @patch("sshmenuc.sync.sync_manager.ensure_repo_initialized", return_value=True)
+    @patch("sshmenuc.sync.sync_manager.is_remote_reachable", return_value=True)
+    @patch("sshmenuc.sync.sync_manager.get_or_prompt", return_value=PASSPHRASE)
+    def test_failed_background_fetch_is_retried_interactively(self, mock_pass, mock_reach, mock_ensure,
+                                                              mock_pull, mock_has, make_manager):
+        """A background fetch that needed a prompt is run again in the foreground."""
+        mock_pull.side_effect = [PullResult(status=PullStatus.OFFLINE, prompt_refused=True),
+                                 PullResult(status=PullStatus.NO_CHANGE)]
+        m = make_manager(sync_cfg=SYNC_CFG)
+        assert m.startup_pull() == SyncState.SYNC_OK
+        assert mock_pull.call_args_list[0].kwargs == {"interactive": False}
+        assert mock_pull.call_args_list[1].kwargs == {}
+
+    @patch("sshmenuc.sync.sync_manager.has_passphrase", return_value=False)
+    @patch("sshmenuc.sync.sync_manager.pull_remote")
+    @patch("sshmenuc.sync.sync_manager.ensure_repo_initialized", return_value=True)
+    @patch("sshmenuc.sync.sync_manager.is_remote_reachable", return_value=True)
+    @patch("sshmenuc.sync.sync_manager.get_or_prompt", return_value=PASSPHRASE)
+    def test_offline_background_fetch_is_not_retried(self, mock_pass, mock_reach, mock_ensure,
+                                                     mock_pull, mock_has, make_manager):
+        """A background fetch that failed for network reasons is not fetched a second time."""
+        mock_pull.return_value = PullResult(status=PullStatus.OFFLINE)
+        m = make_manager(sync_cfg=SYNC_CFG)
+        assert m.startup_pull() == SyncState.LOCAL_ONLY  # No local backup in this fixture
+        mock_pull.assert_called_once()
+
+    @patch("sshmenuc.sync.sync_manager.has_passphrase", return_value=False)
+    @patch("sshmenuc.sync.sync_manager.pull_remote")
+    @patch("sshmenuc.sync.sync_manager.ensure_repo_initialized", return_value=True)
+    @patch("sshmenuc.sync.sync_manager.is_remote_reachable", return_value=True)
+    def test_interrupted_prompt_does_not_wait_for_fetch(self, mock_reach, mock_ensure, mock_pull,
+                                                        mock_has, make_manager):
+        """Ctrl+C at the passphrase prompt returns at once, the fetch is left behind."""
+        import threading
+        import time
+        release = threading.Event()
+        mock_pull.side_effect = lambda cfg, interactive=True: release.wait(5)
+        m = make_manager(sync_cfg=SYNC_CFG)
+        try:
+            start = time.monotonic()
+            with patch("sshmenuc.sync.sync_manager.get_or_prompt", side_effect=KeyboardInterrupt):
+                with pytest.raises(KeyboardInterrupt):
+                    m.startup_pull()
+            assert time.monotonic() - start < 2  # Did not wait for the 5 s fetch
+        finally:
+            release.set()
+
     @patch("sshmenuc.sync.sync_manager.pull_remote")
     @patch("sshmenuc.sync.sync_manager.ensure_repo_initialized", return_value=True)
     @patch("sshmenuc.sync.sync_manager.is_remote_reachable", return_value=True)
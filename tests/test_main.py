@@ -59,7 +59,7 @@ class TestLegacyImport:
              patch("sshmenuc.main.setup_logging"), \
              patch("sshmenuc.contexts.context_manager.CONTEXTS_CONFIG_PATH", contexts_path), \
              patch("sshmenuc.contexts.context_manager.CONTEXTS_BASE_DIR", context_cache_dir), \
-             patch("sshmenuc.main.ConnectionNavigator", mock_navigator_cls):
+             patch("sshmenuc.core.ConnectionNavigator", mock_navigator_cls):
 
             mock_args = MagicMock()
             mock_args.export = None
@@ -121,7 +121,7 @@ class TestLegacyImport:
         with patch("sshmenuc.main.setup_argument_parser") as mock_parser, \
              patch("sshmenuc.main.setup_logging"), \
              patch("sshmenuc.contexts.context_manager.CONTEXTS_CONFIG_PATH", nonexistent_contexts), \
-             patch("sshmenuc.main.ConnectionNavigator", mock_navigator_cls):
+             patch("sshmenuc.core.ConnectionNavigator", mock_navigator_cls):
 
             mock_args = MagicMock()
             mock_args.export = None
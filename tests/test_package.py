@@ -0,0 +1,40 @@
+"""Tests for the sshmenuc package lazy exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import sshmenuc
+
+
+class TestLazyExports:
+
+    def test_exports_resolve_to_submodule_objects(self):
+        from sshmenuc.core import ConnectionManager
+        from sshmenuc.ui import Colors
+        assert sshmenuc.ConnectionManager is ConnectionManager
+        assert sshmenuc.Colors is Colors
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            sshmenuc.does_not_exist
+
+    def test_import_does_not_load_core(self):
+        code = "import sys, sshmenuc; print('sshmenuc.core' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
+    def test_core_submodule_does_not_load_navigation(self):
+        code = ("import sys, sshmenuc.core.config; "
+                "print('sshmenuc.core.navigation' in sys.modules, 'readchar' in sys.modules)")
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False False"
+
+    def test_core_exports_resolve_lazily(self):
+        import sshmenuc.core
+        from sshmenuc.core.navigation import ConnectionNavigator
+        assert sshmenuc.core.ConnectionNavigator is ConnectionNavigator
+        assert "ConnectionNavigator" in dir(sshmenuc.core)
+        with pytest.raises(AttributeError):
+            sshmenuc.core.does_not_exist
@@ -1,9 +1,12 @@
 """
 Tests for MenuDisplay class.
 """
+import os
+import re
 import pytest
 from unittest.mock import patch
-from sshmenuc.ui.display import MenuDisplay
+from sshmenuc.ui.colors import Colors
+from sshmenuc.ui.display import TABLE_WIDTH, MenuDisplay
 
 
 class TestMenuDisplay:
@@ -14,20 +17,22 @@ class TestMenuDisplay:
         assert display.colors is not None
     
     @patch('subprocess.run')
-    def test_clear_screen_unix(self, mock_run):
-        """Test clear screen on Unix systems."""
+    def test_clear_screen_unix(self, mock_run, capsys):
+        """Test clear screen on Unix systems writes the escape sequence."""
         with patch('os.name', 'posix'):
             display = MenuDisplay()
             display.clear_screen()
-            mock_run.assert_called_once_with(['clear'], shell=True, check=False)
+            mock_run.assert_not_called()
+        assert capsys.readouterr().out == "\033[H\033[2J"
 
     @patch('subprocess.run')
-    def test_clear_screen_windows(self, mock_run):
-        """Test clear screen on Windows systems."""
+    def test_clear_screen_windows(self, mock_run, capsys):
+        """Test clear screen on Windows writes the escape sequence without spawning cls."""
         with patch('os.name', 'nt'):
             display = MenuDisplay()
             display.clear_screen()
-            mock_run.assert_called_once_with(['cls'], shell=True, check=False)
+            mock_run.assert_not_called()
+        assert capsys.readouterr().out == "\033[H\033[2J"
     
     @patch('builtins.print')
     def test_print_instructions(self, mock_print):
@@ -87,6 +92,16 @@ class TestMenuDisplay:
         assert "test-host" in printed_text
         assert "[ ]" in printed_text
     
+    @pytest.mark.parametrize("selected", [False, True])
+    def test_format_row_long_title_fits_one_line(self, selected):
+        """Test a long host name is cut to its column, keeping the row TABLE_WIDTH wide."""
+        display = MenuDisplay()
+        host_dict = {"friendly": "very-long-host-name.datacenter.example.com", "host": "h"}
+        row = display.format_row([0, host_dict], selected, True, False)
+        visible = re.sub(r"\033\[[0-9;]*m", "", row)
+        assert len(visible) == TABLE_WIDTH
+        assert "very-long-host-name.datacenter" in visible
+
     @patch('builtins.print')
     def test_print_footer(self, mock_print):
         """Test printing table footer."""
@@ -98,18 +113,19 @@ class TestMenuDisplay:
         assert "+" in printed_text
         assert "-" in printed_text
     
-    @patch('builtins.print')
-    def test_print_table_dict(self, mock_print):
+    def test_print_table_dict(self, capsys):
         """Test printing table with dictionary data."""
         display = MenuDisplay()
         data = {"Category1": [], "Category2": []}
         display.print_table(data, 0, set(), 0)
         
-        # Should print header + 2 rows + footer
-        assert mock_print.call_count >= 4
+        # Should print header (3 lines) + 2 rows + footer
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 6
+        assert "Category1" in lines[3]
+        assert "Category2" in lines[4]
     
-    @patch('builtins.print')
-    def test_print_table_list(self, mock_print):
+    def test_print_table_list(self, capsys):
         """Test printing table with list data."""
         display = MenuDisplay()
         data = [
@@ -118,14 +134,125 @@ class TestMenuDisplay:
         ]
         display.print_table(data, 0, {1}, 0)
         
-        # Should print header + 2 rows + footer
-        assert mock_print.call_count >= 4
+        # Should print header (3 lines) + 2 rows + footer
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 6
+        assert "[ ]" in lines[3] and "host1" in lines[3]
+        assert "[x]" in lines[4] and "host2" in lines[4]
     
-    @patch('builtins.print')
-    def test_print_table_empty_list(self, mock_print):
+    def test_format_instructions_cached_per_labels(self):
+        """Test the instructions line is built once per (sync, context) label pair."""
+        display = MenuDisplay()
+        line = display.format_instructions("SYNC OK", "home")
+        assert line.endswith("[SYNC OK]")
+        assert "[x]ctx:home" in line
+        assert display.format_instructions("SYNC OK", "home") is line
+        assert "[x]ctx" not in display.format_instructions("SYNC OK", "")
+
+    def test_format_header_reused(self):
+        """Test header lines are built once and returned as a fresh list."""
+        display = MenuDisplay()
+        first = display.format_header(["Description"])
+        first.append("extra")
+        second = display.format_header(["Description"])
+
+        assert len(second) == 3
+        assert second[1] is first[1]
+        assert second[0] == display.format_footer()
+
+    def test_print_table_subgroups(self, capsys):
+        """Test subgroup entries are rendered with their group name."""
+        display = MenuDisplay()
+        data = [{"Admin": []}, {"friendly": "host1", "host": "host1.com"}]
+        display.print_table(data, 0, set(), 1)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "Admin" in lines[3] and "[ ]" not in lines[3]
+        assert "[ ]" in lines[4] and "host1" in lines[4]
+
+    def test_print_table_empty_list(self, capsys):
         """Test printing table with empty list."""
         display = MenuDisplay()
         display.print_table([], 0, set(), 0)
         
         # Should print header + footer only
-        assert mock_print.call_count >= 2
\ No newline at end of file
+        assert len(capsys.readouterr().out.splitlines()) == 4
+
+    @patch('sys.stdout')
+    def test_print_table_single_write(self, mock_stdout):
+        """Test the whole table is emitted with one write call."""
+        display = MenuDisplay()
+        display.print_table({"Category1": [], "Category2": []}, 0, set(), 0)
+
+        mock_stdout.write.assert_called_once()
+
+    def test_print_search_results(self, capsys):
+        """Test search results are listed with the selected one highlighted."""
+        display = MenuDisplay()
+        results = [
+            ("HDP", {"friendly": "nn-01", "host": "nn.local", "tags": ["hadoop"]}),
+            ("HDP > Prod", {"host": "rm.local"}),
+        ]
+        display.print_search_results("hdp", results, 1)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 3
+        assert "cerca: hdp_" in lines[0] and "(2 risultati)" in lines[0]
+        assert lines[1] == "    HDP > nn-01  [hadoop]"
+        assert lines[2] == f"{Colors.OKGREEN}→   HDP > Prod > rm.local{Colors.ENDC}"
+
+    def test_print_search_results_empty(self, capsys):
+        """Test an empty result set shows the no-results line."""
+        display = MenuDisplay()
+        display.print_search_results("zzz", [], 0)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert "nessun risultato" in lines[1]
+
+    @patch('shutil.get_terminal_size', return_value=os.terminal_size((80, 24)))
+    def test_repaint_rows_rewrites_given_rows(self, mock_size, capsys):
+        """Test only the old and new selected rows are rewritten."""
+        display = MenuDisplay()
+        data = {"Category1": [], "Category2": [], "Category3": []}
+
+        assert display.repaint_rows(data, {0, 1}, 1, set()) is True
+        out = capsys.readouterr().out
+        # Row 0 is 4 lines above the cursor (3 rows + footer), row 1 is 3 lines above
+        assert out.startswith("\033[4A\r\033[2K")
+        assert "\033[3A\r\033[2K" in out
+        assert "Category1" in out and "Category2" in out
+        assert "Category3" not in out
+
+    @patch('shutil.get_terminal_size', return_value=os.terminal_size((80, 24)))
+    def test_repaint_rows_shows_mark_state(self, mock_size, capsys):
+        """Test a repainted row reflects its current mark, and other rows are untouched."""
+        display = MenuDisplay()
+        data = [{"friendly": "web", "host": "web.example.com"}, {"friendly": "db", "host": "db.example.com"}]
+
+        assert display.repaint_rows(data, {1}, 0, {1}) is True
+        out = capsys.readouterr().out
+        # Row 1 is 2 lines above the cursor (1 row + footer)
+        assert out.startswith("\033[2A\r\033[2K")
+        assert out.count("\033[2K") == 1
+        assert "db" in out and "web" not in out
+
+    @patch('shutil.get_terminal_size', return_value=os.terminal_size((80, 3)))
+    def test_repaint_rows_terminal_too_short(self, mock_size, capsys):
+        """Test repaint is refused when the rows may have scrolled off screen."""
+        display = MenuDisplay()
+        data = {"Category1": [], "Category2": [], "Category3": []}
+
+        assert display.repaint_rows(data, {0, 1}, 1, set()) is False
+        assert capsys.readouterr().out == ""
+
+    @patch('shutil.get_terminal_size', return_value=os.terminal_size((80, 24)))
+    def test_repaint_rows_long_host_name_stays_on_one_line(self, mock_size, capsys):
+        """Test a row with a long host name is repainted as a single terminal line."""
+        display = MenuDisplay()
+        data = [{"friendly": "x" * 80, "host": "h"}, {"friendly": "db", "host": "db.example.com"}]
+
+        assert display.repaint_rows(data, {0}, 0, set()) is True
+        out = capsys.readouterr().out
+        row = out[len("\033[3A\r\033[2K"):-len("\r\033[3B")]
+        assert len(re.sub(r"\033\[[0-9;]*m", "", row)) == TABLE_WIDTH
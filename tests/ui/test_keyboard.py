@@ -0,0 +1,132 @@
+"""
+Tests for keyboard input reading.
+"""
+import pytest
+from unittest.mock import patch
+import readchar
+from sshmenuc.ui.keyboard import cbreak, cooked, decode_keys, read_keys
+
+
+class TestKeyboard:
+
+    def test_decode_single_keys(self):
+        """Test plain characters are returned one per key."""
+        assert decode_keys("q") == ["q"]
+        assert decode_keys("ab ") == ["a", "b", " "]
+
+    def test_decode_arrow_burst(self):
+        """Test repeated arrow sequences are split into readchar key constants."""
+        keys = decode_keys(readchar.key.DOWN * 3 + readchar.key.UP)
+        assert keys == [readchar.key.DOWN] * 3 + [readchar.key.UP]
+
+    def test_decode_long_sequences(self):
+        """Test multi-byte sequences are kept whole like readchar does."""
+        assert decode_keys(readchar.key.DELETE + "x") == [readchar.key.DELETE, "x"]
+        assert decode_keys(readchar.key.F1 + readchar.key.ENTER) == [readchar.key.F1, readchar.key.ENTER]
+
+    @pytest.mark.parametrize("text", ["\r", "\n", readchar.key.UP + "\r"])
+    def test_decode_enter_from_cr_or_lf(self, text):
+        """Test CR and LF both decode to readchar.key.ENTER, whatever its value."""
+        assert decode_keys(text)[-1] == readchar.key.ENTER
+
+    def test_decode_lone_escape(self):
+        """Test a trailing ESC is returned as its own key."""
+        assert decode_keys("a\x1b") == ["a", readchar.key.ESC]
+
+    def test_decode_ctrl_c(self):
+        """Test Ctrl+C raises KeyboardInterrupt like readchar."""
+        with pytest.raises(KeyboardInterrupt):
+            decode_keys("a" + readchar.key.CTRL_C)
+
+    @patch('readchar.readkey', return_value="q")
+    @patch('sshmenuc.ui.keyboard.os.isatty', return_value=False)
+    def test_read_keys_not_a_tty(self, mock_isatty, mock_readkey):
+        """Test non-terminal input falls back to readchar."""
+        assert read_keys() == ["q"]
+        mock_readkey.assert_called_once()
+
+    @patch('sshmenuc.ui.keyboard.os.read', return_value=b"jj" + readchar.key.DOWN.encode())
+    @patch('sshmenuc.ui.keyboard.os.isatty', return_value=True)
+    @patch('sshmenuc.ui.keyboard.sys.stdin')
+    @patch('sshmenuc.ui.keyboard.termios')
+    def test_read_keys_in_cbreak_only_reads(self, mock_termios, mock_stdin, mock_isatty, mock_read):
+        """Test cbreak() sets the mode once for several reads and restores it untouched."""
+        saved = [0xFFFF, 0, 0, 0xFFFF, 0, 0, [b"\x00"] * 32]
+        mock_termios.tcgetattr.return_value = saved
+        mock_termios.VMIN, mock_termios.VTIME = 6, 5
+        mock_termios.ICRNL = 0x100
+        mock_stdin.fileno.return_value = 0
+
+        with cbreak():
+            assert read_keys() == ["j", "j", readchar.key.DOWN]
+            assert read_keys() == ["j", "j", readchar.key.DOWN]
+        mock_termios.tcgetattr.assert_called_once_with(0)
+        assert mock_termios.tcsetattr.call_count == 2
+        mode = mock_termios.tcsetattr.call_args_list[0][0][2]
+        assert mode[6][6] == 1 and mode[6][5] == 0
+        assert not mode[0] & 0x100
+        assert mock_termios.tcsetattr.call_args_list[1][0][2] == [0xFFFF, 0, 0, 0xFFFF, 0, 0, [b"\x00"] * 32]
+
+    @patch('readchar.readkey', return_value="\r")
+    @patch('sshmenuc.ui.keyboard.os.read')
+    @patch('sshmenuc.ui.keyboard.os.isatty', return_value=True)
+    @patch('sshmenuc.ui.keyboard.sys.stdin')
+    @patch('sshmenuc.ui.keyboard.termios')
+    def test_read_keys_outside_cbreak_uses_readchar(self, mock_termios, mock_stdin, mock_isatty,
+                                                    mock_read, mock_readkey):
+        """Test a terminal outside cbreak() is read through readchar, never with os.read()."""
+        mock_stdin.fileno.return_value = 0
+
+        assert read_keys() == [readchar.key.ENTER]
+        assert read_keys(wait=False) == []
+        mock_read.assert_not_called()
+        mock_termios.tcsetattr.assert_not_called()
+
+    @patch('sshmenuc.ui.keyboard.os.isatty', return_value=True)
+    @patch('sshmenuc.ui.keyboard.sys.stdin')
+    @patch('sshmenuc.ui.keyboard.termios')
+    def test_cooked_restores_then_reapplies_cbreak(self, mock_termios, mock_stdin, mock_isatty):
+        """Test cooked() switches back to the saved mode and re-enters cbreak on exit."""
+        saved = [0, 0, 0, 0xFFFF, 0, 0, [b"\x00"] * 32]
+        mode = [0, 0, 0, 0, 0, 0, [b"\x00"] * 32]
+        mock_termios.tcgetattr.side_effect = [saved, mode, saved]
+        mock_stdin.fileno.return_value = 0
+
+        with cbreak():
+            with cooked():
+                assert mock_termios.tcsetattr.call_args[0][2] is saved
+                with cbreak():  # A nested prompt may set its own cbreak mode
+                    pass
+            assert mock_termios.tcsetattr.call_args[0][2] is mode
+        assert mock_termios.tcsetattr.call_args[0][2] is saved
+
+    @patch('sshmenuc.ui.keyboard.termios')
+    def test_cooked_outside_cbreak_is_noop(self, mock_termios):
+        """Test cooked() leaves the terminal alone when cbreak() is not active."""
+        with cooked():
+            pass
+        mock_termios.tcsetattr.assert_not_called()
+
+    @patch('readchar.readkey')
+    @patch('sshmenuc.ui.keyboard.os.isatty', return_value=False)
+    def test_read_keys_no_wait_not_a_tty(self, mock_isatty, mock_readkey):
+        """Test a non-blocking read never falls back to a blocking readchar call."""
+        assert read_keys(wait=False) == []
+        mock_readkey.assert_not_called()
+
+    @patch('sshmenuc.ui.keyboard.os.read')
+    @patch('sshmenuc.ui.keyboard.select.select', return_value=([], [], []))
+    @patch('sshmenuc.ui.keyboard.os.isatty', return_value=True)
+    @patch('sshmenuc.ui.keyboard.sys.stdin')
+    @patch('sshmenuc.ui.keyboard.termios')
+    def test_read_keys_no_wait_nothing_pending(self, mock_termios, mock_stdin, mock_isatty,
+                                               mock_select, mock_read):
+        """Test a non-blocking read with no input returns at once without touching the mode."""
+        mock_termios.tcgetattr.return_value = [0, 0, 0, 0, 0, 0, [b"\x00"] * 32]
+        mock_stdin.fileno.return_value = 0
+
+        with cbreak():
+            assert read_keys(wait=False) == []
+            assert mock_termios.tcsetattr.call_count == 1
+        mock_select.assert_called_once_with([0], [], [], 0)
+        mock_read.assert_not_called()
@@ -9,6 +9,9 @@ from sshmenuc.utils.helpers import (
     setup_argument_parser,
     setup_logging,
     get_default_config_path,
+    get_current_user,
+    get_entry_user,
+    key_at,
     validate_host_entry
 )
 
@@ -118,4 +121,35 @@ class TestHelpers:
             "identity_file": "/path/to/key",
             "certkey": "/path/to/cert"
         }
-        assert validate_host_entry(entry) is True
\ No newline at end of file
+        assert validate_host_entry(entry) is True
+
+    @patch('sshmenuc.utils.helpers.get_current_user')
+    def test_get_entry_user_explicit(self, mock_current_user):
+        """Test explicit user is returned without resolving the current user."""
+        assert get_entry_user({"host": "test.com", "user": "admin"}) == "admin"
+        mock_current_user.assert_not_called()
+
+    @patch('sshmenuc.utils.helpers.get_current_user', return_value="testuser")
+    def test_get_entry_user_fallback(self, mock_current_user):
+        """Test entries without user fall back to the current user."""
+        assert get_entry_user({"host": "test.com"}) == "testuser"
+
+    @patch('os.getlogin', return_value="testuser")
+    def test_get_current_user_looked_up_once(self, mock_getlogin):
+        """Test the current user is resolved once and then served from cache."""
+        assert get_current_user() == "testuser"
+        assert get_entry_user({"host": "a.com"}) == "testuser"
+        assert get_entry_user({"host": "b.com"}) == "testuser"
+        mock_getlogin.assert_called_once()
+
+    def test_key_at(self):
+        """Test positional key lookup follows insertion order."""
+        mapping = {"b": 1, "a": 2, "c": 3}
+        assert key_at(mapping, 0) == "b"
+        assert key_at(mapping, 2) == "c"
+
+    def test_key_at_out_of_range(self):
+        """Test out-of-range positions return None."""
+        assert key_at({"a": 1}, 1) is None
+        assert key_at({"a": 1}, -1) is None
+        assert key_at({}, 0) is None
@@ -0,0 +1,191 @@
+"""
+Tests for JSON serialization helpers.
+"""
+import json
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+from sshmenuc.utils import serialization
+
+
+SAMPLE = {"targets": [{"Prod": [{"friendly": "web", "host": "web.example.com", "port": 22}]}]}
+
+
+class TestSerialization:
+
+    def test_round_trip(self):
+        """Test dumps output parses back to the same object."""
+        assert serialization.loads(serialization.dumps(SAMPLE)) == SAMPLE
+
+    def test_loads_accepts_str_and_bytes(self):
+        """Test both text and raw file content are accepted."""
+        assert serialization.loads('{"a": 1}') == {"a": 1}
+        assert serialization.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_loads_invalid_raises_json_error(self):
+        """Test invalid documents raise json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads(b"{not json")
+
+    @patch.object(serialization, "orjson", None)
+    def test_stdlib_fallback_keeps_indent_4(self):
+        """Test the stdlib fallback writes the same layout as json.dump(indent=4)."""
+        assert serialization.dumps(SAMPLE) == json.dumps(SAMPLE, indent=4).encode("utf-8")
+
+    @patch.object(serialization, "orjson", None)
+    def test_stdlib_compact(self):
+        """Test compact output has no indentation or padding."""
+        assert serialization.dumps({"a": [1, 2]}, pretty=False) == b'{"a":[1,2]}'
+
+    def test_dumps_layout_does_not_depend_on_orjson(self):
+        """Test orjson is never used for writing, so the file layout stays the same."""
+        fake = MagicMock()
+        with patch.object(serialization, "orjson", fake):
+            assert serialization.dumps(SAMPLE) == json.dumps(SAMPLE, indent=4).encode("utf-8")
+            assert serialization.dumps({"a": [1, 2]}, pretty=False) == b'{"a":[1,2]}'
+        fake.dumps.assert_not_called()
+
+    def test_dump_and_load_file(self, tmp_path):
+        """Test writing and reading a JSON file."""
+        path = str(tmp_path / "config.json")
+        serialization.dump_file(SAMPLE, path)
+        assert serialization.load_file(path) == SAMPLE
+
+    def test_load_file_maps_large_files_for_orjson(self, tmp_path):
+        """Test orjson parses large files from a memory map instead of a bytes copy."""
+        path = tmp_path / "config.json"
+        path.write_bytes(json.dumps({"pad": "x" * serialization.MMAP_THRESHOLD}).encode())
+        fake = MagicMock()
+        fake.loads.side_effect = lambda buf: (type(buf), json.loads(bytes(buf)))
+        with patch.object(serialization, "orjson", fake):
+            kind, data = serialization.load_file(str(path))
+        assert kind is memoryview
+        assert len(data["pad"]) == serialization.MMAP_THRESHOLD
+
+    def test_load_file_reads_small_files(self, tmp_path):
+        """Test small files are read into bytes before parsing."""
+        path = tmp_path / "config.json"
+        path.write_text('{"a": 1}')
+        fake = MagicMock()
+        fake.loads.side_effect = lambda buf: type(buf)
+        with patch.object(serialization, "orjson", fake):
+            assert serialization.load_file(str(path)) is bytes
+
+    def test_dump_file_unserializable_keeps_existing_file(self, tmp_path):
+        """Test a serialization error does not truncate the existing file."""
+        path = tmp_path / "config.json"
+        path.write_text('{"a": 1}')
+        with pytest.raises(TypeError):
+            serialization.dump_file({"a": object()}, str(path))
+        assert path.read_text() == '{"a": 1}'
+
+    def test_dump_file_replaces_atomically(self, tmp_path):
+        """Test a failed write leaves the previous file intact and no temp file behind."""
+        path = tmp_path / "config.json"
+        path.write_text('{"a": 1}')
+        with patch("sshmenuc.utils.serialization.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                serialization.dump_file(SAMPLE, str(path))
+        assert path.read_text() == '{"a": 1}'
+        assert os.listdir(tmp_path) == ["config.json"]
+
+    def test_dump_file_keeps_mode(self, tmp_path):
+        """Test rewriting a file keeps its permission bits."""
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        os.chmod(path, 0o600)
+        serialization.dump_file(SAMPLE, str(path))
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+    def test_dump_file_temp_never_wider_than_target(self, tmp_path):
+        """Test the temp file already has the target's mode when data is written."""
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        os.chmod(path, 0o600)
+        (tmp_path / "config.json.tmp").write_text("stale")
+        os.chmod(tmp_path / "config.json.tmp", 0o644)
+        modes = []
+        real_write = os.write
+
+        class Recorder:
+            def __init__(self, fd):
+                self.fd = fd
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                os.close(self.fd)
+
+            def fileno(self):
+                return self.fd
+
+            def write(self, data):
+                modes.append(os.fstat(self.fd).st_mode & 0o777)
+                real_write(self.fd, data)
+
+        old_umask = os.umask(0)
+        try:
+            with patch("sshmenuc.utils.serialization.os.fdopen", side_effect=lambda fd, m: Recorder(fd)):
+                serialization.dump_file(SAMPLE, str(path))
+        finally:
+            os.umask(old_umask)
+        assert modes == [0o600]
+        assert json.loads(path.read_text()) == SAMPLE
+
+    def test_dump_file_follows_symlink(self, tmp_path):
+        """Test writing through a symlink updates the target, not the link."""
+        real = tmp_path / "real.json"
+        real.write_text("{}")
+        link = tmp_path / "config.json"
+        link.symlink_to(real)
+        serialization.dump_file(SAMPLE, str(link))
+        assert link.is_symlink()
+        assert json.loads(real.read_text()) == SAMPLE
+
+    def test_snapshot_restores_independent_copies(self):
+        """Test each restore() is a fresh copy that edits cannot leak out of."""
+        snap = serialization.snapshot(SAMPLE)
+        first = serialization.restore(snap)
+        first["targets"][0]["Prod"].append({"host": "new"})
+        assert serialization.restore(snap) == SAMPLE
+        assert first is not SAMPLE
+
+
+class TestSerializationWithOrjson:
+    """Run the orjson code paths for real; skipped when orjson is not installed."""
+
+    @pytest.fixture(autouse=True)
+    def real_orjson(self):
+        orjson = pytest.importorskip("orjson")
+        with patch.object(serialization, "orjson", orjson):
+            yield orjson
+
+    def test_loads(self):
+        """Test orjson parses both text and bytes."""
+        assert serialization.loads('{"a": 1}') == {"a": 1}
+        assert serialization.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_loads_invalid_raises_json_error(self):
+        """Test orjson errors are caught as json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads(b"{not json")
+
+    def test_load_file_small(self, tmp_path):
+        """Test a small file is read and parsed by orjson."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(SAMPLE, indent=4))
+        assert serialization.load_file(str(path)) == SAMPLE
+
+    def test_load_file_large_from_mmap(self, tmp_path):
+        """Test a file above MMAP_THRESHOLD is parsed from the memory map."""
+        path = tmp_path / "config.json"
+        data = {"targets": SAMPLE["targets"], "pad": "x" * serialization.MMAP_THRESHOLD}
+        path.write_text(json.dumps(data))
+        assert serialization.load_file(str(path)) == data
+
+    def test_dump_file_keeps_indent_4(self, tmp_path):
+        """Test writing is unaffected by orjson being installed."""
+        path = tmp_path / "config.json"
+        serialization.dump_file(SAMPLE, str(path))
+        assert path.read_bytes() == json.dumps(SAMPLE, indent=4).encode("utf-8")